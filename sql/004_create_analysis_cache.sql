@@ -0,0 +1,18 @@
+-- GPT analysis cache, keyed on a hash of the prompt inputs
+CREATE TABLE analysis_cache (
+    cache_key VARCHAR(64) PRIMARY KEY,
+    symbol VARCHAR(20) NOT NULL,
+    response JSONB NOT NULL,
+    expires_at TIMESTAMPTZ NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX idx_analysis_cache_expires_at ON analysis_cache(expires_at);
+
+-- Function to purge expired cache entries
+CREATE OR REPLACE FUNCTION purge_expired_analysis_cache()
+RETURNS void AS $$
+BEGIN
+    DELETE FROM analysis_cache WHERE expires_at < NOW();
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,2 @@
+-- Publish signal inserts to Supabase Realtime so the Telegram bot is pushed new signals
+ALTER PUBLICATION supabase_realtime ADD TABLE signals;
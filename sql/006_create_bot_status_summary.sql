@@ -0,0 +1,16 @@
+-- Function to fetch everything /status shows in a single round trip
+CREATE OR REPLACE FUNCTION bot_status_summary()
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        'open_trades', (SELECT COUNT(*) FROM trades WHERE status = 'OPEN'),
+        'pending_signals', (
+            SELECT COUNT(*) FROM signals
+            WHERE status = 'PENDING' AND expires_at > NOW()
+        ),
+        'portfolio', (
+            SELECT row_to_json(p) FROM (
+                SELECT * FROM portfolio ORDER BY timestamp DESC LIMIT 1
+            ) p
+        )
+    );
+$$ LANGUAGE sql STABLE;
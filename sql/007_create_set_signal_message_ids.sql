@@ -0,0 +1,8 @@
+-- Function to record Telegram message ids for many signals in one UPDATE
+CREATE OR REPLACE FUNCTION set_signal_message_ids(updates JSONB)
+RETURNS void AS $$
+    UPDATE signals s
+    SET telegram_message_id = (u->>'telegram_message_id')::BIGINT
+    FROM jsonb_array_elements(updates) u
+    WHERE s.id = (u->>'id')::UUID;
+$$ LANGUAGE sql;
@@ -2,16 +2,38 @@
 Market condition analyzer.
 """
 
+import math
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
+
+from src.shared.jit import njit
 from src.shared.models import TechnicalIndicators
 from src.shared.logger import get_logger
 
 logger = get_logger(__name__)
 
-
-@dataclass
+# Thresholds are searched with side="right", so a value equal to a threshold
+# falls into the next bucket. Inclusive upper bounds are nudged up by one ulp.
+_RSI_THRESHOLDS = np.array([30.0, math.nextafter(70.0, math.inf)])
+_SENTIMENT_THRESHOLDS = np.array(
+    [
+        math.nextafter(20.0, math.inf),
+        math.nextafter(40.0, math.inf),
+        60.0,
+        80.0,
+    ]
+)
+
+_TREND_LABELS = ("neutral", "bullish", "bearish")
+_RSI_LABELS = ("oversold", "neutral", "overbought")
+_MACD_LABELS = ("neutral", "bullish_cross", "bearish_cross")
+_BB_LABELS = ("neutral", "oversold", "overbought")
+_SENTIMENT_LABELS = ("extreme_fear", "fear", "neutral", "greed", "extreme_greed")
+
+
+@dataclass(slots=True, frozen=True)
 class MarketContext:
     """Preprocessed market context for GPT analysis."""
     trend: str
@@ -21,6 +43,69 @@ class MarketContext:
     sentiment_signal: str
     summary: str
 
+    @property
+    def confirming_signals(self) -> int:
+        """Number of non-neutral signals."""
+        signals = (
+            self.trend,
+            self.rsi_signal,
+            self.macd_signal,
+            self.bb_signal,
+            self.sentiment_signal,
+        )
+        return sum(signal != "neutral" for signal in signals)
+
+
+@njit(cache=True)
+def _classify_signals(
+    sma_20: float,
+    sma_50: float,
+    rsi: float,
+    macd_histogram: float,
+    macd_line: float,
+    macd_signal: float,
+    bb_upper: float,
+    bb_lower: float,
+    price: float,
+    sentiment: float,
+):
+    """Classify indicators into label codes. Missing values are NaN."""
+    trend = 0
+    if not (np.isnan(sma_20) or np.isnan(sma_50)):
+        if sma_20 > sma_50:
+            trend = 1
+        elif sma_20 < sma_50:
+            trend = 2
+
+    rsi_code = 1
+    if not np.isnan(rsi):
+        rsi_code = np.searchsorted(_RSI_THRESHOLDS, rsi, side="right")
+
+    macd = 0
+    if not (np.isnan(macd_histogram) or np.isnan(macd_line) or np.isnan(macd_signal)):
+        if macd_histogram > 0 and macd_line > macd_signal:
+            macd = 1
+        elif macd_histogram < 0 and macd_line < macd_signal:
+            macd = 2
+
+    bb = 0
+    if not (np.isnan(bb_upper) or np.isnan(bb_lower)):
+        if price <= bb_lower:
+            bb = 1
+        elif price >= bb_upper:
+            bb = 2
+
+    sentiment_code = 2
+    if not np.isnan(sentiment):
+        sentiment_code = np.searchsorted(_SENTIMENT_THRESHOLDS, sentiment, side="right")
+
+    return trend, rsi_code, macd, bb, sentiment_code
+
+
+def _as_float(value: Optional[float]) -> float:
+    """Convert an optional indicator to float, treating unset values as NaN."""
+    return float(value) if value else math.nan
+
 
 def analyze_market_conditions(
     indicators: TechnicalIndicators,
@@ -29,41 +114,7 @@ def analyze_market_conditions(
 ) -> MarketContext:
     """Analyze market conditions and create context for GPT."""
 
-    # Determine trend from SMAs
-    trend = "neutral"
-    if indicators.sma_20 and indicators.sma_50:
-        if indicators.sma_20 > indicators.sma_50:
-            trend = "bullish"
-        elif indicators.sma_20 < indicators.sma_50:
-            trend = "bearish"
-
-    # RSI signal
-    rsi_signal = "neutral"
-    if indicators.rsi_14:
-        if indicators.rsi_14 < 30:
-            rsi_signal = "oversold"
-        elif indicators.rsi_14 > 70:
-            rsi_signal = "overbought"
-
-    # MACD signal
-    macd_signal = "neutral"
-    if indicators.macd_histogram:
-        if indicators.macd_histogram > 0 and indicators.macd_line and indicators.macd_signal:
-            if indicators.macd_line > indicators.macd_signal:
-                macd_signal = "bullish_cross"
-        elif indicators.macd_histogram < 0 and indicators.macd_line and indicators.macd_signal:
-            if indicators.macd_line < indicators.macd_signal:
-                macd_signal = "bearish_cross"
-
-    # Bollinger Bands signal
-    bb_signal = "neutral"
-    if indicators.bb_upper and indicators.bb_lower:
-        if indicators.current_price <= indicators.bb_lower:
-            bb_signal = "oversold"
-        elif indicators.current_price >= indicators.bb_upper:
-            bb_signal = "overbought"
-
-    # Sentiment signal
+    # Average the available sentiment sources
     avg_sentiment = None
     if fear_greed_value is not None and coingecko_value is not None:
         avg_sentiment = (fear_greed_value + coingecko_value) / 2
@@ -72,16 +123,24 @@ def analyze_market_conditions(
     elif coingecko_value is not None:
         avg_sentiment = coingecko_value
 
-    sentiment_signal = "neutral"
-    if avg_sentiment is not None:
-        if avg_sentiment <= 20:
-            sentiment_signal = "extreme_fear"
-        elif avg_sentiment <= 40:
-            sentiment_signal = "fear"
-        elif avg_sentiment >= 80:
-            sentiment_signal = "extreme_greed"
-        elif avg_sentiment >= 60:
-            sentiment_signal = "greed"
+    # Classify trend, RSI, MACD, Bollinger Bands and sentiment
+    trend_code, rsi_code, macd_code, bb_code, sentiment_code = _classify_signals(
+        _as_float(indicators.sma_20),
+        _as_float(indicators.sma_50),
+        _as_float(indicators.rsi_14),
+        _as_float(indicators.macd_histogram),
+        _as_float(indicators.macd_line),
+        _as_float(indicators.macd_signal),
+        _as_float(indicators.bb_upper),
+        _as_float(indicators.bb_lower),
+        float(indicators.current_price),
+        math.nan if avg_sentiment is None else float(avg_sentiment),
+    )
+    trend = _TREND_LABELS[trend_code]
+    rsi_signal = _RSI_LABELS[rsi_code]
+    macd_signal = _MACD_LABELS[macd_code]
+    bb_signal = _BB_LABELS[bb_code]
+    sentiment_signal = _SENTIMENT_LABELS[sentiment_code]
 
     # Create summary
     rsi_str = f"{indicators.rsi_14:.1f}" if indicators.rsi_14 else "N/A"
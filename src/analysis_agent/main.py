@@ -4,7 +4,8 @@ Runs as a Railway cron job every 15 minutes (after data collector).
 """
 
 import asyncio
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Optional
 
@@ -18,6 +19,19 @@ from .openai_client import get_gpt_analysis
 
 logger = get_logger(__name__)
 
+_MIN_CONFIDENCE = Decimal(str(TRADING.MIN_CONFIDENCE))
+_STOP_LOSS_PCT = Decimal(str(TRADING.STOP_LOSS_PCT))
+_TAKE_PROFIT_PCT = Decimal(str(TRADING.TAKE_PROFIT_PCT))
+
+# Entry price multipliers for stop loss / take profit by side
+_BUY_SL_MULT = 1 - _STOP_LOSS_PCT
+_BUY_TP_MULT = 1 + _TAKE_PROFIT_PCT
+_SELL_SL_MULT = 1 + _STOP_LOSS_PCT
+_SELL_TP_MULT = 1 - _TAKE_PROFIT_PCT
+
+# Symbols analysed at once; caps concurrent OpenAI requests as SYMBOLS grows
+ANALYSIS_CONCURRENCY = 4
+
 
 def _calculate_bb_position(indicators: TechnicalIndicators) -> Optional[str]:
     """Calculate position relative to Bollinger Bands."""
@@ -33,99 +47,139 @@ def _calculate_bb_position(indicators: TechnicalIndicators) -> Optional[str]:
         return "within_bands"
 
 
-async def generate_signals() -> None:
-    """Main signal generation orchestrator."""
-    logger.info("Starting analysis cycle")
-    start_time = datetime.utcnow()
-
-    try:
-        for symbol in DATA_COLLECTOR.SYMBOLS:
-            # Get recent candle data
-            candles = DatabaseClient.get_candles(
-                symbol=symbol, timeframe="15m", limit=100
+async def _process_symbol(
+    symbol: str, semaphore: asyncio.Semaphore
+) -> Optional[SignalCreate]:
+    """Run the analysis pipeline for a single symbol."""
+    async with semaphore:
+        # Get recent close prices (oldest first for indicator calculation)
+        prices = await DatabaseClient.get_closes(
+            symbol=symbol, timeframe="15m", limit=100
+        )
+
+        if len(prices) < 50:
+            logger.warning(f"Insufficient data for {symbol}")
+            return None
+
+        current_price = float(prices[-1])
+        timestamp = datetime.now(timezone.utc)
+
+        # Calculate technical indicators
+        indicators = calculate_all_indicators(symbol, prices, timestamp)
+
+        # Get sentiment data
+        fear_greed, coingecko = await asyncio.gather(
+            DatabaseClient.get_latest_sentiment("fear_greed"),
+            DatabaseClient.get_latest_sentiment("coingecko", symbol),
+        )
+
+        # Prepare market context for GPT
+        market_context = analyze_market_conditions(
+            indicators=indicators,
+            fear_greed_value=float(fear_greed["value"]) if fear_greed else None,
+            coingecko_value=float(coingecko["value"]) if coingecko else None,
+        )
+
+        # Skip GPT when too few indicators agree to reach the confidence bar
+        if market_context.confirming_signals < TRADING.MIN_CONFIRMING_SIGNALS:
+            logger.info(
+                f"Skipping GPT for {symbol}: "
+                f"{market_context.confirming_signals} confirming signal(s)"
             )
+            return None
 
-            if not candles or len(candles) < 50:
-                logger.warning(f"Insufficient data for {symbol}")
-                continue
+        # Get GPT analysis
+        analysis = await get_gpt_analysis(
+            symbol=symbol, indicators=indicators, market_context=market_context
+        )
 
-            # Extract prices (oldest first for indicator calculation)
-            prices = [float(c["close"]) for c in reversed(candles)]
-            current_price = prices[-1]
-            timestamp = datetime.utcnow()
+        if not analysis:
+            logger.warning(f"No analysis returned for {symbol}")
+            return None
 
-            # Calculate technical indicators
-            indicators = calculate_all_indicators(symbol, prices, timestamp)
+        # Only create signals at 90%+ confidence
+        confidence = Decimal(str(analysis.confidence))
+        if analysis.should_trade and confidence >= _MIN_CONFIDENCE:
+            entry_price = Decimal(str(current_price))
 
-            # Get sentiment data
-            fear_greed = DatabaseClient.get_latest_sentiment("fear_greed")
-            coingecko = DatabaseClient.get_latest_sentiment("coingecko", symbol)
-
-            # Prepare market context for GPT
-            market_context = analyze_market_conditions(
-                indicators=indicators,
-                fear_greed_value=float(fear_greed["value"]) if fear_greed else None,
-                coingecko_value=float(coingecko["value"]) if coingecko else None,
+            if analysis.signal_type == SignalType.BUY:
+                stop_loss = entry_price * _BUY_SL_MULT
+                take_profit = entry_price * _BUY_TP_MULT
+            else:
+                stop_loss = entry_price * _SELL_SL_MULT
+                take_profit = entry_price * _SELL_TP_MULT
+
+            signal = SignalCreate(
+                symbol=symbol,
+                signal_type=analysis.signal_type,
+                confidence=confidence,
+                entry_price=entry_price,
+                stop_loss_price=stop_loss,
+                take_profit_price=take_profit,
+                analysis_summary=analysis.reasoning,
+                technical_data={
+                    "rsi": indicators.rsi_14,
+                    "sma_20": indicators.sma_20,
+                    "sma_50": indicators.sma_50,
+                    "macd": indicators.macd_histogram,
+                    "bb_position": _calculate_bb_position(indicators),
+                    "fear_greed": fear_greed["value"] if fear_greed else None,
+                    "key_factors": analysis.key_factors,
+                },
             )
 
-            # Get GPT analysis
-            analysis = await get_gpt_analysis(
-                symbol=symbol, indicators=indicators, market_context=market_context
+            logger.info(
+                f"Generated {analysis.signal_type} signal for {symbol} "
+                f"at {entry_price:.2f} with {analysis.confidence}% confidence"
             )
+            return signal
 
-            if not analysis:
-                logger.warning(f"No analysis returned for {symbol}")
-                continue
-
-            # Only create signals at 90%+ confidence
-            if analysis.should_trade and analysis.confidence >= TRADING.MIN_CONFIDENCE:
-                entry_price = current_price
-
-                if analysis.signal_type == SignalType.BUY:
-                    stop_loss = entry_price * (1 - TRADING.STOP_LOSS_PCT)
-                    take_profit = entry_price * (1 + TRADING.TAKE_PROFIT_PCT)
-                else:
-                    stop_loss = entry_price * (1 + TRADING.STOP_LOSS_PCT)
-                    take_profit = entry_price * (1 - TRADING.TAKE_PROFIT_PCT)
-
-                signal = SignalCreate(
-                    symbol=symbol,
-                    signal_type=analysis.signal_type,
-                    confidence=Decimal(str(analysis.confidence)),
-                    entry_price=Decimal(str(entry_price)),
-                    stop_loss_price=Decimal(str(stop_loss)),
-                    take_profit_price=Decimal(str(take_profit)),
-                    analysis_summary=analysis.reasoning,
-                    technical_data={
-                        "rsi": indicators.rsi_14,
-                        "sma_20": indicators.sma_20,
-                        "sma_50": indicators.sma_50,
-                        "macd": indicators.macd_histogram,
-                        "bb_position": _calculate_bb_position(indicators),
-                        "fear_greed": fear_greed["value"] if fear_greed else None,
-                        "key_factors": analysis.key_factors,
-                    },
-                )
-
-                DatabaseClient.create_signal(signal)
-                logger.info(
-                    f"Created {analysis.signal_type} signal for {symbol} "
-                    f"at {entry_price:.2f} with {analysis.confidence}% confidence"
-                )
-            else:
-                logger.info(
-                    f"No signal for {symbol}: "
-                    f"should_trade={analysis.should_trade}, "
-                    f"confidence={analysis.confidence}%"
-                )
+        logger.info(
+            f"No signal for {symbol}: "
+            f"should_trade={analysis.should_trade}, "
+            f"confidence={analysis.confidence}%"
+        )
+        return None
+
+
+async def generate_signals() -> None:
+    """Main signal generation orchestrator."""
+    logger.info("Starting analysis cycle")
+    start_time = time.monotonic()
 
-        elapsed = (datetime.utcnow() - start_time).total_seconds()
+    try:
+        # Analyze symbols concurrently, at most ANALYSIS_CONCURRENCY at a time
+        semaphore = asyncio.Semaphore(ANALYSIS_CONCURRENCY)
+        results = await asyncio.gather(
+            *[_process_symbol(s, semaphore) for s in DATA_COLLECTOR.SYMBOLS],
+            return_exceptions=True,
+        )
+
+        failures = [
+            (symbol, result)
+            for symbol, result in zip(DATA_COLLECTOR.SYMBOLS, results)
+            if isinstance(result, Exception)
+        ]
+        for symbol, error in failures:
+            logger.error(f"Analysis failed for {symbol}: {error}", exc_info=error)
+
+        # Persist every generated signal in one insert
+        signals = [r for r in results if isinstance(r, SignalCreate)]
+        await DatabaseClient.create_signals(signals)
+
+        elapsed = time.monotonic() - start_time
         logger.info(f"Analysis cycle completed in {elapsed:.2f}s")
 
+        if failures:
+            raise RuntimeError(f"Analysis failed for {len(failures)} symbol(s)")
+
     except Exception as e:
         logger.error(f"Analysis cycle failed: {e}", exc_info=True)
         raise
 
+    finally:
+        await DatabaseClient.close()
+
 
 def main() -> None:
     """Entry point for Railway cron job."""
@@ -2,17 +2,30 @@
 OpenAI GPT-4o-mini integration for trading signal analysis.
 """
 
+import hashlib
+import json
 from typing import Optional
 
 from openai import AsyncOpenAI
 
 from src.shared.config import API, TRADING
+from src.shared.db import DatabaseClient
 from src.shared.models import TechnicalIndicators, SignalType, GPTAnalysisResponse
 from src.shared.logger import get_logger
 from .analyzer import MarketContext
 
 logger = get_logger(__name__)
 
+_client: Optional[AsyncOpenAI] = None
+
+
+def _get_client() -> AsyncOpenAI:
+    """Get or create the shared OpenAI client."""
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(api_key=API.OPENAI_API_KEY)
+    return _client
+
 
 SYSTEM_PROMPT = f"""You are an expert cryptocurrency trading analyst. Your task is to analyze market data and provide trading recommendations.
 
@@ -38,36 +51,133 @@ You MUST respond with valid JSON in this exact format:
 }}"""
 
 
-async def get_gpt_analysis(
-    symbol: str,
-    indicators: TechnicalIndicators,
-    market_context: MarketContext,
-) -> Optional[GPTAnalysisResponse]:
-    """Get trading analysis from GPT-4o-mini."""
-    client = AsyncOpenAI(api_key=API.OPENAI_API_KEY)
-
-    user_prompt = f"""Analyze the following market data for {symbol}:
+ANALYSIS_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "should_trade": {"type": "boolean"},
+        "signal_type": {
+            "type": ["string", "null"],
+            "enum": [t.value for t in SignalType] + [None],
+        },
+        "confidence": {"type": "number"},
+        "reasoning": {"type": "string"},
+        "key_factors": {"type": "array", "items": {"type": "string"}},
+        "risk_assessment": {"type": "string"},
+    },
+    "required": [
+        "should_trade",
+        "signal_type",
+        "confidence",
+        "reasoning",
+        "key_factors",
+        "risk_assessment",
+    ],
+    "additionalProperties": False,
+}
+
+USER_PROMPT_TEMPLATE = f"""Analyze the following market data for {{symbol}}:
 
 TECHNICAL INDICATORS:
-- Current Price: ${indicators.current_price:,.2f}
-- RSI (14): {indicators.rsi_14:.2f if indicators.rsi_14 else 'N/A'}
-- SMA 20: ${indicators.sma_20:,.2f if indicators.sma_20 else 'N/A'}
-- SMA 50: ${indicators.sma_50:,.2f if indicators.sma_50 else 'N/A'}
-- MACD Line: {indicators.macd_line:.4f if indicators.macd_line else 'N/A'}
-- MACD Signal: {indicators.macd_signal:.4f if indicators.macd_signal else 'N/A'}
-- MACD Histogram: {indicators.macd_histogram:.4f if indicators.macd_histogram else 'N/A'}
-- Bollinger Upper: ${indicators.bb_upper:,.2f if indicators.bb_upper else 'N/A'}
-- Bollinger Middle: ${indicators.bb_middle:,.2f if indicators.bb_middle else 'N/A'}
-- Bollinger Lower: ${indicators.bb_lower:,.2f if indicators.bb_lower else 'N/A'}
+- Current Price: {{current_price}}
+- RSI (14): {{rsi}}
+- SMA 20: {{sma_20}}
+- SMA 50: {{sma_50}}
+- MACD Line: {{macd_line}}
+- MACD Signal: {{macd_signal}}
+- MACD Histogram: {{macd_histogram}}
+- Bollinger Upper: {{bb_upper}}
+- Bollinger Middle: {{bb_middle}}
+- Bollinger Lower: {{bb_lower}}
 
 MARKET CONTEXT:
-{market_context.summary}
+{{summary}}
 
 ANALYSIS REQUEST:
 Based on the above data, should I enter a trade? If yes, should it be BUY or SELL?
 Only recommend a trade if you have {TRADING.MIN_CONFIDENCE}%+ confidence with multiple confirming indicators.
 Respond with JSON only."""
 
+
+def _fmt(value: Optional[float], spec: str, prefix: str = "") -> str:
+    """Format an optional indicator value, falling back to N/A."""
+    if value is None:
+        return "N/A"
+    return prefix + format(value, spec)
+
+
+def _cache_key(
+    symbol: str, indicators: TechnicalIndicators, market_context: MarketContext
+) -> str:
+    """Hash the prompt inputs into an analysis cache key."""
+    payload = {
+        "symbol": symbol,
+        "rsi": indicators.rsi_14,
+        "sma_20": indicators.sma_20,
+        "sma_50": indicators.sma_50,
+        "macd_histogram": indicators.macd_histogram,
+        "bb_upper": indicators.bb_upper,
+        "bb_lower": indicators.bb_lower,
+        "current_price": indicators.current_price,
+        "summary": market_context.summary,
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.blake2b(encoded, digest_size=32).hexdigest()
+
+
+async def _get_cached_analysis(cache_key: str) -> Optional[GPTAnalysisResponse]:
+    """Look up a cached analysis, treating cache errors as misses."""
+    try:
+        cached = await DatabaseClient.get_cached_analysis(cache_key)
+    except Exception as e:
+        logger.warning(f"Analysis cache lookup failed: {e}")
+        return None
+    return GPTAnalysisResponse.model_validate(cached) if cached else None
+
+
+async def _cache_analysis(
+    cache_key: str, symbol: str, analysis: GPTAnalysisResponse
+) -> None:
+    """Store an analysis in the cache, ignoring cache errors."""
+    try:
+        await DatabaseClient.cache_analysis(
+            cache_key,
+            symbol,
+            analysis.model_dump(mode="json"),
+            TRADING.ANALYSIS_CACHE_TTL_MINUTES,
+        )
+    except Exception as e:
+        logger.warning(f"Analysis cache write failed: {e}")
+
+
+async def get_gpt_analysis(
+    symbol: str,
+    indicators: TechnicalIndicators,
+    market_context: MarketContext,
+) -> Optional[GPTAnalysisResponse]:
+    """Get trading analysis from GPT-4o-mini."""
+    cache_key = _cache_key(symbol, indicators, market_context)
+    cached = await _get_cached_analysis(cache_key)
+    if cached:
+        logger.info(f"Using cached GPT analysis for {symbol}")
+        return cached
+
+    client = _get_client()
+
+    user_prompt = USER_PROMPT_TEMPLATE.format(
+        symbol=symbol,
+        current_price=_fmt(indicators.current_price, ",.2f", "$"),
+        rsi=_fmt(indicators.rsi_14, ".2f"),
+        sma_20=_fmt(indicators.sma_20, ",.2f", "$"),
+        sma_50=_fmt(indicators.sma_50, ",.2f", "$"),
+        macd_line=_fmt(indicators.macd_line, ".4f"),
+        macd_signal=_fmt(indicators.macd_signal, ".4f"),
+        macd_histogram=_fmt(indicators.macd_histogram, ".4f"),
+        bb_upper=_fmt(indicators.bb_upper, ",.2f", "$"),
+        bb_middle=_fmt(indicators.bb_middle, ",.2f", "$"),
+        bb_lower=_fmt(indicators.bb_lower, ",.2f", "$"),
+        summary=market_context.summary,
+    )
+
     try:
         response = await client.chat.completions.create(
             model=API.OPENAI_MODEL,
@@ -75,29 +185,24 @@ Respond with JSON only."""
                 {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt},
             ],
-            temperature=0.3,
-            max_tokens=1000,
-            response_format={"type": "json_object"},
+            temperature=0.2,
+            max_tokens=300,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "trading_analysis",
+                    "strict": True,
+                    "schema": ANALYSIS_RESPONSE_SCHEMA,
+                },
+            },
         )
 
-        content = response.choices[0].message.content
+        message = response.choices[0].message
+        if not message.content:
+            logger.warning(f"GPT returned no content for {symbol}: {message.refusal}")
+            return None
 
-        import json
-        data = json.loads(content)
-
-        # Convert signal_type string to enum if present
-        signal_type = None
-        if data.get("signal_type"):
-            signal_type = SignalType(data["signal_type"].upper())
-
-        analysis = GPTAnalysisResponse(
-            should_trade=data.get("should_trade", False),
-            signal_type=signal_type,
-            confidence=data.get("confidence", 0),
-            reasoning=data.get("reasoning", ""),
-            key_factors=data.get("key_factors", []),
-            risk_assessment=data.get("risk_assessment", ""),
-        )
+        analysis = GPTAnalysisResponse.model_validate_json(message.content)
 
         logger.info(
             f"GPT analysis for {symbol}: "
@@ -106,6 +211,7 @@ Respond with JSON only."""
             f"confidence={analysis.confidence}%"
         )
 
+        await _cache_analysis(cache_key, symbol, analysis)
         return analysis
 
     except Exception as e:
@@ -2,7 +2,7 @@
 Binance OHLCV data fetcher using CCXT.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 
 import ccxt.async_support as ccxt
@@ -13,35 +13,54 @@ from src.shared.logger import get_logger
 
 logger = get_logger(__name__)
 
+_exchange: Optional[ccxt.binance] = None
+
+
+def _get_exchange() -> ccxt.binance:
+    """Get or create the shared Binance exchange client."""
+    global _exchange
+    if _exchange is None:
+        _exchange = ccxt.binance(
+            {
+                "apiKey": API.BINANCE_API_KEY,
+                "secret": API.BINANCE_SECRET,
+                "enableRateLimit": True,
+            }
+        )
+
+        if API.BINANCE_TESTNET:
+            _exchange.set_sandbox_mode(True)
+    return _exchange
+
+
+async def close_binance() -> None:
+    """Close the shared Binance exchange client."""
+    global _exchange
+    if _exchange is not None:
+        await _exchange.close()
+        _exchange = None
+
 
 async def fetch_ohlcv_data(
     symbol: str, timeframe: str = "15m", limit: int = 100
 ) -> Optional[List[OHLCVCandle]]:
     """Fetch OHLCV candle data from Binance."""
-    exchange = ccxt.binance(
-        {
-            "apiKey": API.BINANCE_API_KEY,
-            "secret": API.BINANCE_SECRET,
-            "enableRateLimit": True,
-        }
-    )
-
-    if API.BINANCE_TESTNET:
-        exchange.set_sandbox_mode(True)
+    exchange = _get_exchange()
 
     try:
         logger.info(f"Fetching {limit} {timeframe} candles for {symbol}")
 
         ohlcv = await exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
 
+        # Exchange rows are already numeric, so skip per-candle validation
         candles = []
         for candle in ohlcv:
             timestamp, open_price, high, low, close, volume = candle
             candles.append(
-                OHLCVCandle(
+                OHLCVCandle.model_construct(
                     symbol=symbol,
                     timeframe=timeframe,
-                    timestamp=datetime.utcfromtimestamp(timestamp / 1000),
+                    timestamp=datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc),
                     open=open_price,
                     high=high,
                     low=low,
@@ -56,6 +75,3 @@ async def fetch_ohlcv_data(
     except Exception as e:
         logger.error(f"Failed to fetch OHLCV for {symbol}: {e}")
         return None
-
-    finally:
-        await exchange.close()
@@ -2,7 +2,7 @@
 CoinGecko API client for sentiment data.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 import httpx
@@ -22,24 +22,25 @@ COIN_ID_MAP = {
 }
 
 
-async def fetch_coingecko_sentiment(coin_id: str) -> Optional[SentimentData]:
+async def fetch_coingecko_sentiment(
+    coin_id: str, client: httpx.AsyncClient
+) -> Optional[SentimentData]:
     """Fetch sentiment data for a specific coin from CoinGecko."""
     cg_coin_id = COIN_ID_MAP.get(coin_id.lower(), coin_id.lower())
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{API.COINGECKO_API_URL}/coins/{cg_coin_id}",
-                params={
-                    "localization": "false",
-                    "tickers": "false",
-                    "market_data": "true",
-                    "community_data": "true",
-                    "developer_data": "false",
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await client.get(
+            f"{API.COINGECKO_API_URL}/coins/{cg_coin_id}",
+            params={
+                "localization": "false",
+                "tickers": "false",
+                "market_data": "true",
+                "community_data": "true",
+                "developer_data": "false",
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
 
         sentiment_votes = data.get("sentiment_votes_up_percentage", 50) or 50
         sentiment_value = min(100, max(0, sentiment_votes))
@@ -58,7 +59,7 @@ async def fetch_coingecko_sentiment(coin_id: str) -> Optional[SentimentData]:
         sentiment = SentimentData(
             source=SentimentSource.COINGECKO,
             symbol=f"{coin_id.upper()}/USDT",
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
             value=sentiment_value,
             classification=classification,
             raw_data={
@@ -2,7 +2,7 @@
 Alternative.me Fear & Greed Index API client.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 import httpx
@@ -14,15 +14,14 @@ from src.shared.logger import get_logger
 logger = get_logger(__name__)
 
 
-async def fetch_fear_greed_index() -> Optional[SentimentData]:
+async def fetch_fear_greed_index(client: httpx.AsyncClient) -> Optional[SentimentData]:
     """Fetch current Fear & Greed Index from Alternative.me."""
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                API.FEAR_GREED_API_URL, params={"limit": 1, "format": "json"}
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await client.get(
+            API.FEAR_GREED_API_URL, params={"limit": 1, "format": "json"}
+        )
+        response.raise_for_status()
+        data = response.json()
 
         if not data.get("data"):
             logger.warning("No Fear & Greed data returned")
@@ -31,7 +30,7 @@ async def fetch_fear_greed_index() -> Optional[SentimentData]:
         fng_data = data["data"][0]
         value = int(fng_data["value"])
         classification = fng_data["value_classification"]
-        timestamp = datetime.utcfromtimestamp(int(fng_data["timestamp"]))
+        timestamp = datetime.fromtimestamp(int(fng_data["timestamp"]), tz=timezone.utc)
 
         sentiment = SentimentData(
             source=SentimentSource.FEAR_GREED,
@@ -4,12 +4,16 @@ Runs as a Railway cron job every 15 minutes.
 """
 
 import asyncio
-from datetime import datetime
+import time
+from typing import List
+
+import httpx
 
 from src.shared.config import validate_config, DATA_COLLECTOR
 from src.shared.db import DatabaseClient
+from src.shared.models import OHLCVCandle, SentimentData
 from src.shared.logger import get_logger
-from .binance_client import fetch_ohlcv_data
+from .binance_client import fetch_ohlcv_data, close_binance
 from .fear_greed import fetch_fear_greed_index
 from .coingecko import fetch_coingecko_sentiment
 
@@ -19,39 +23,63 @@ logger = get_logger(__name__)
 async def collect_all_data() -> None:
     """Main data collection orchestrator."""
     logger.info("Starting data collection cycle")
-    start_time = datetime.utcnow()
+    start_time = time.monotonic()
 
     try:
-        # Fetch OHLCV data for all configured symbols and timeframes
-        for symbol in DATA_COLLECTOR.SYMBOLS:
-            for timeframe in DATA_COLLECTOR.TIMEFRAMES:
-                candles = await fetch_ohlcv_data(
-                    symbol=symbol,
-                    timeframe=timeframe,
-                    limit=DATA_COLLECTOR.CANDLES_LIMIT,
-                )
-                if candles:
-                    DatabaseClient.insert_candles(candles)
-
-        # Fetch Fear & Greed Index
-        fear_greed = await fetch_fear_greed_index()
-        if fear_greed:
-            DatabaseClient.insert_sentiment(fear_greed)
-
-        # Fetch CoinGecko sentiment for each symbol
-        for symbol in DATA_COLLECTOR.SYMBOLS:
-            coin_id = symbol.split("/")[0].lower()
-            sentiment = await fetch_coingecko_sentiment(coin_id)
-            if sentiment:
-                DatabaseClient.insert_sentiment(sentiment)
-
-        elapsed = (datetime.utcnow() - start_time).total_seconds()
+        # Fetch OHLCV data and sentiment for all symbols/timeframes concurrently
+        ohlcv_tasks = [
+            fetch_ohlcv_data(
+                symbol=symbol,
+                timeframe=timeframe,
+                limit=DATA_COLLECTOR.CANDLES_LIMIT,
+            )
+            for symbol in DATA_COLLECTOR.SYMBOLS
+            for timeframe in DATA_COLLECTOR.TIMEFRAMES
+        ]
+        async with httpx.AsyncClient(http2=True, timeout=10) as client:
+            sentiment_tasks = [fetch_fear_greed_index(client)] + [
+                fetch_coingecko_sentiment(symbol.split("/")[0].lower(), client)
+                for symbol in DATA_COLLECTOR.SYMBOLS
+            ]
+
+            results = await asyncio.gather(
+                *ohlcv_tasks, *sentiment_tasks, return_exceptions=True
+            )
+
+        ohlcv_results = results[: len(ohlcv_tasks)]
+        sentiment_results = results[len(ohlcv_tasks) :]
+
+        all_candles: List[OHLCVCandle] = []
+        for candles in ohlcv_results:
+            if isinstance(candles, Exception):
+                logger.error(f"OHLCV fetch failed: {candles}")
+            elif candles:
+                all_candles.extend(candles)
+
+        all_sentiment: List[SentimentData] = []
+        for sentiment in sentiment_results:
+            if isinstance(sentiment, Exception):
+                logger.error(f"Sentiment fetch failed: {sentiment}")
+            elif sentiment:
+                all_sentiment.append(sentiment)
+
+        # Write everything in one round trip per table
+        await asyncio.gather(
+            DatabaseClient.insert_candles(all_candles),
+            DatabaseClient.insert_sentiments(all_sentiment),
+        )
+
+        elapsed = time.monotonic() - start_time
         logger.info(f"Data collection completed in {elapsed:.2f}s")
 
     except Exception as e:
         logger.error(f"Data collection failed: {e}", exc_info=True)
         raise
 
+    finally:
+        await close_binance()
+        await DatabaseClient.close()
+
 
 def main() -> None:
     """Entry point for Railway cron job."""
@@ -20,6 +20,13 @@ class TradingConfig:
     TAKE_PROFIT_PCT: float = 0.04
     MAX_OPEN_POSITIONS: int = 5
     SIGNAL_EXPIRY_HOURS: int = 4
+    MIN_CONFIRMING_SIGNALS: int = 2
+    ANALYSIS_CACHE_TTL_MINUTES: int = 10
+    TRADER_LONG_RUNNING: bool = field(
+        default_factory=lambda: os.getenv("TRADER_LONG_RUNNING", "false").lower()
+        in ("1", "true")
+    )
+    TRADER_CYCLE_SECONDS: int = 300
 
 
 @dataclass(frozen=True)
@@ -2,10 +2,17 @@
 Supabase database client.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-
-from supabase import create_client, Client
+import asyncio
+import functools
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Callable, Tuple
+
+import httpx
+import numpy as np
+from pydantic import TypeAdapter
+from realtime import AsyncRealtimeChannel
+from supabase import acreate_client, AsyncClient, AsyncClientOptions
 
 from .config import API
 from .models import (
@@ -22,50 +29,127 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=50, keepalive_expiry=300
+)
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+# Connection attempts retried by the transport; requests themselves are not
+HTTP_CONNECT_RETRIES = 2
+
+# Read-cache TTLs in seconds, aligned with how often each table changes
+SIGNAL_CACHE_TTL = 10
+TRADE_CACHE_TTL = 10
+PORTFOLIO_CACHE_TTL = 60
+
+_query_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+
+
+def _ttl_cached(ttl: float) -> Callable:
+    """Cache a read query's result for `ttl` seconds, keyed on its arguments."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(cls, *args: Any, **kwargs: Any) -> Any:
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            cached = _query_cache.get(key)
+            if cached and cached[0] > now:
+                return cached[1]
+            result = await func(cls, *args, **kwargs)
+            _query_cache[key] = (now + ttl, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_query_cache() -> None:
+    """Drop all cached reads; called after every write."""
+    _query_cache.clear()
+
+
+# Serializes a whole candle list to JSON-ready dicts in one pydantic-core pass
+_CANDLE_ROWS = TypeAdapter(List[OHLCVCandle])
+
+# Rows per upsert request; larger payloads are split and sent concurrently
+UPSERT_BATCH_SIZE = 500
+
 
 class DatabaseClient:
     """Supabase client wrapper."""
 
-    _instance: Optional[Client] = None
+    _instance: Optional[AsyncClient] = None
+    _session: Optional[httpx.AsyncClient] = None
+    _lock = asyncio.Lock()
 
     @classmethod
-    def get_client(cls) -> Client:
-        """Get or create Supabase client."""
+    async def get_client(cls) -> AsyncClient:
+        """Get or create the async Supabase client."""
         if cls._instance is None:
-            cls._instance = create_client(API.SUPABASE_URL, API.SUPABASE_KEY)
+            async with cls._lock:
+                if cls._instance is None:
+                    # One pooled HTTP/2 session shared by concurrent queries
+                    transport = httpx.AsyncHTTPTransport(
+                        http2=True,
+                        limits=HTTP_LIMITS,
+                        retries=HTTP_CONNECT_RETRIES,
+                    )
+                    cls._session = httpx.AsyncClient(
+                        transport=transport, timeout=HTTP_TIMEOUT
+                    )
+                    cls._instance = await acreate_client(
+                        API.SUPABASE_URL,
+                        API.SUPABASE_KEY,
+                        options=AsyncClientOptions(httpx_client=cls._session),
+                    )
         return cls._instance
 
+    @classmethod
+    async def close(cls) -> None:
+        """Close the Supabase client, its Realtime channels and HTTP session."""
+        if cls._instance is not None and cls._instance.get_channels():
+            await cls._instance.remove_all_channels()
+        if cls._session is not None:
+            await cls._session.aclose()
+        cls._instance = None
+        cls._session = None
+
+    @classmethod
+    async def _upsert_batched(
+        cls, table: str, rows: List[Dict[str, Any]], on_conflict: str
+    ) -> None:
+        """Upsert rows in UPSERT_BATCH_SIZE chunks, one request per chunk."""
+        client = await cls.get_client()
+        await asyncio.gather(
+            *(
+                client.table(table)
+                .upsert(rows[i : i + UPSERT_BATCH_SIZE], on_conflict=on_conflict)
+                .execute()
+                for i in range(0, len(rows), UPSERT_BATCH_SIZE)
+            )
+        )
+
     # ==================== Market Data ====================
 
     @classmethod
-    def insert_candles(cls, candles: List[OHLCVCandle]) -> None:
+    async def insert_candles(cls, candles: List[OHLCVCandle]) -> None:
         """Insert OHLCV candles with upsert."""
-        client = cls.get_client()
-        data = [
-            {
-                "symbol": c.symbol,
-                "timeframe": c.timeframe,
-                "timestamp": c.timestamp.isoformat(),
-                "open": float(c.open),
-                "high": float(c.high),
-                "low": float(c.low),
-                "close": float(c.close),
-                "volume": float(c.volume),
-            }
-            for c in candles
-        ]
-        client.table("market_data").upsert(
-            data, on_conflict="symbol,timeframe,timestamp"
-        ).execute()
-        logger.info(f"Inserted {len(candles)} candles")
+        if not candles:
+            return
+        data = _CANDLE_ROWS.dump_python(candles, mode="json")
+        await cls._upsert_batched(
+            "market_data", data, on_conflict="symbol,timeframe,timestamp"
+        )
+        logger.info("Inserted %d candles", len(candles))
 
     @classmethod
-    def get_candles(
+    async def get_candles(
         cls, symbol: str, timeframe: str = "15m", limit: int = 100
     ) -> List[Dict[str, Any]]:
         """Get recent candles for a symbol."""
-        client = cls.get_client()
-        response = (
+        client = await cls.get_client()
+        response = await (
             client.table("market_data")
             .select("*")
             .eq("symbol", symbol)
@@ -76,13 +160,34 @@ class DatabaseClient:
         )
         return response.data
 
+    @classmethod
+    async def get_closes(
+        cls, symbol: str, timeframe: str = "15m", limit: int = 100
+    ) -> np.ndarray:
+        """Get recent close prices for a symbol, oldest first."""
+        client = await cls.get_client()
+        response = await (
+            client.table("market_data")
+            .select("close")
+            .eq("symbol", symbol)
+            .eq("timeframe", timeframe)
+            .order("timestamp", desc=True)
+            .limit(limit)
+            .execute()
+        )
+        rows = response.data
+        closes = np.fromiter(
+            (row["close"] for row in rows), dtype=np.float64, count=len(rows)
+        )
+        # Rows arrive newest first; a reversed slice is a view, not a copy
+        return closes[::-1]
+
     # ==================== Sentiment Data ====================
 
-    @classmethod
-    def insert_sentiment(cls, sentiment: SentimentData) -> None:
-        """Insert sentiment data."""
-        client = cls.get_client()
-        data = {
+    @staticmethod
+    def _sentiment_row(sentiment: SentimentData) -> Dict[str, Any]:
+        """Serialize sentiment data for the sentiment_data table."""
+        return {
             "source": sentiment.source.value,
             "symbol": sentiment.symbol,
             "timestamp": sentiment.timestamp.isoformat(),
@@ -90,17 +195,34 @@ class DatabaseClient:
             "classification": sentiment.classification,
             "raw_data": sentiment.raw_data,
         }
-        client.table("sentiment_data").upsert(
-            data, on_conflict="source,symbol,timestamp"
+
+    @classmethod
+    async def insert_sentiment(cls, sentiment: SentimentData) -> None:
+        """Insert sentiment data."""
+        client = await cls.get_client()
+        await client.table("sentiment_data").upsert(
+            cls._sentiment_row(sentiment), on_conflict="source,symbol,timestamp"
         ).execute()
-        logger.info(f"Inserted sentiment from {sentiment.source}")
+        logger.info("Inserted sentiment from %s", sentiment.source)
+
+    @classmethod
+    async def insert_sentiments(cls, sentiments: List[SentimentData]) -> None:
+        """Insert multiple sentiment records with batched upserts."""
+        if not sentiments:
+            return
+        await cls._upsert_batched(
+            "sentiment_data",
+            [cls._sentiment_row(s) for s in sentiments],
+            on_conflict="source,symbol,timestamp",
+        )
+        logger.info("Inserted %d sentiment records", len(sentiments))
 
     @classmethod
-    def get_latest_sentiment(
+    async def get_latest_sentiment(
         cls, source: str, symbol: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Get most recent sentiment data."""
-        client = cls.get_client()
+        client = await cls.get_client()
         query = client.table("sentiment_data").select("*").eq("source", source)
 
         if symbol:
@@ -108,16 +230,55 @@ class DatabaseClient:
         else:
             query = query.is_("symbol", "null")
 
-        response = query.order("timestamp", desc=True).limit(1).execute()
+        response = await query.order("timestamp", desc=True).limit(1).execute()
         return response.data[0] if response.data else None
 
-    # ==================== Signals ====================
+    # ==================== Analysis Cache ====================
 
     @classmethod
-    def create_signal(cls, signal: SignalCreate, expiry_hours: int = 4) -> Signal:
-        """Create a new trading signal."""
-        client = cls.get_client()
-        data = {
+    async def get_cached_analysis(
+        cls, cache_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get an unexpired cached GPT analysis."""
+        client = await cls.get_client()
+        response = await (
+            client.table("analysis_cache")
+            .select("response")
+            .eq("cache_key", cache_key)
+            .gt("expires_at", datetime.now(timezone.utc).isoformat())
+            .limit(1)
+            .execute()
+        )
+        return response.data[0]["response"] if response.data else None
+
+    @classmethod
+    async def cache_analysis(
+        cls,
+        cache_key: str,
+        symbol: str,
+        analysis: Dict[str, Any],
+        ttl_minutes: int = 10,
+    ) -> None:
+        """Store a GPT analysis in the cache."""
+        client = await cls.get_client()
+        await client.table("analysis_cache").upsert(
+            {
+                "cache_key": cache_key,
+                "symbol": symbol,
+                "response": analysis,
+                "expires_at": (
+                    datetime.now(timezone.utc) + timedelta(minutes=ttl_minutes)
+                ).isoformat(),
+            },
+            on_conflict="cache_key",
+        ).execute()
+
+    # ==================== Signals ====================
+
+    @staticmethod
+    def _signal_row(signal: SignalCreate, expires_at: str) -> Dict[str, Any]:
+        """Serialize a signal for the signals table."""
+        return {
             "symbol": signal.symbol,
             "signal_type": signal.signal_type.value,
             "confidence": float(signal.confidence),
@@ -126,29 +287,58 @@ class DatabaseClient:
             "take_profit_price": float(signal.take_profit_price),
             "analysis_summary": signal.analysis_summary,
             "technical_data": signal.technical_data,
-            "expires_at": (datetime.utcnow() + timedelta(hours=expiry_hours)).isoformat(),
+            "expires_at": expires_at,
         }
 
-        response = client.table("signals").insert(data).execute()
-        logger.info(f"Created signal: {signal.signal_type} {signal.symbol}")
+    @classmethod
+    async def create_signal(
+        cls, signal: SignalCreate, expiry_hours: int = 4
+    ) -> Signal:
+        """Create a new trading signal."""
+        client = await cls.get_client()
+        now = datetime.now(timezone.utc)
+        expires_at = (now + timedelta(hours=expiry_hours)).isoformat()
+        data = cls._signal_row(signal, expires_at)
+
+        response = await client.table("signals").insert(data).execute()
+        invalidate_query_cache()
+        logger.info("Created signal: %s %s", signal.signal_type, signal.symbol)
         return Signal(**response.data[0])
 
     @classmethod
-    def get_pending_signals(cls) -> List[Dict[str, Any]]:
+    async def create_signals(
+        cls, signals: List[SignalCreate], expiry_hours: int = 4
+    ) -> List[Signal]:
+        """Create multiple trading signals in a single insert."""
+        if not signals:
+            return []
+        client = await cls.get_client()
+        now = datetime.now(timezone.utc)
+        expires_at = (now + timedelta(hours=expiry_hours)).isoformat()
+        data = [cls._signal_row(s, expires_at) for s in signals]
+
+        response = await client.table("signals").insert(data).execute()
+        invalidate_query_cache()
+        logger.info("Created %d signals", len(signals))
+        return [Signal(**row) for row in response.data]
+
+    @classmethod
+    @_ttl_cached(SIGNAL_CACHE_TTL)
+    async def get_pending_signals(cls, columns: str = "*") -> List[Dict[str, Any]]:
         """Get all pending signals that haven't expired."""
-        client = cls.get_client()
-        response = (
+        client = await cls.get_client()
+        response = await (
             client.table("signals")
-            .select("*")
+            .select(columns)
             .eq("status", SignalStatus.PENDING.value)
-            .gt("expires_at", datetime.utcnow().isoformat())
+            .gt("expires_at", datetime.now(timezone.utc).isoformat())
             .order("created_at", desc=True)
             .execute()
         )
         return response.data
 
     @classmethod
-    def update_signal_status(
+    async def update_signal_status(
         cls,
         signal_id: str,
         status: SignalStatus,
@@ -156,23 +346,38 @@ class DatabaseClient:
         approved_by: Optional[str] = None,
     ) -> None:
         """Update signal status."""
-        client = cls.get_client()
+        client = await cls.get_client()
         data = {"status": status.value}
 
         if telegram_message_id:
             data["telegram_message_id"] = telegram_message_id
         if approved_by:
             data["approved_by"] = approved_by
-            data["approved_at"] = datetime.utcnow().isoformat()
+            data["approved_at"] = datetime.now(timezone.utc).isoformat()
 
-        client.table("signals").update(data).eq("id", signal_id).execute()
-        logger.info(f"Updated signal {signal_id} to {status.value}")
+        await client.table("signals").update(data).eq("id", signal_id).execute()
+        invalidate_query_cache()
+        logger.info("Updated signal %s to %s", signal_id, status.value)
 
     @classmethod
-    def get_signal_by_message_id(cls, message_id: int) -> Optional[Dict[str, Any]]:
+    async def set_signal_message_ids(cls, message_ids: Dict[str, int]) -> None:
+        """Record Telegram message ids for several signals in one update."""
+        client = await cls.get_client()
+        updates = [
+            {"id": signal_id, "telegram_message_id": message_id}
+            for signal_id, message_id in message_ids.items()
+        ]
+        await client.rpc("set_signal_message_ids", {"updates": updates}).execute()
+        invalidate_query_cache()
+        logger.info("Recorded message ids for %d signals", len(updates))
+
+    @classmethod
+    async def get_signal_by_message_id(
+        cls, message_id: int
+    ) -> Optional[Dict[str, Any]]:
         """Get signal by Telegram message ID."""
-        client = cls.get_client()
-        response = (
+        client = await cls.get_client()
+        response = await (
             client.table("signals")
             .select("*")
             .eq("telegram_message_id", message_id)
@@ -181,10 +386,10 @@ class DatabaseClient:
         return response.data[0] if response.data else None
 
     @classmethod
-    def get_approved_signals(cls) -> List[Dict[str, Any]]:
+    async def get_approved_signals(cls) -> List[Dict[str, Any]]:
         """Get approved signals ready for execution."""
-        client = cls.get_client()
-        response = (
+        client = await cls.get_client()
+        response = await (
             client.table("signals")
             .select("*")
             .eq("status", SignalStatus.APPROVED.value)
@@ -193,18 +398,44 @@ class DatabaseClient:
         return response.data
 
     @classmethod
-    def get_signal_by_id(cls, signal_id: str) -> Optional[Dict[str, Any]]:
+    async def subscribe_signal_inserts(
+        cls, callback: Callable[[Dict[str, Any]], None]
+    ) -> AsyncRealtimeChannel:
+        """Subscribe to Realtime INSERT events on the signals table."""
+        client = await cls.get_client()
+        channel = client.channel("signals")
+        channel.on_postgres_changes(
+            "INSERT", callback=callback, table="signals", schema="public"
+        )
+        await channel.subscribe()
+        return channel
+
+    @classmethod
+    async def get_signal_by_id(cls, signal_id: str) -> Optional[Dict[str, Any]]:
         """Get signal by ID."""
-        client = cls.get_client()
-        response = client.table("signals").select("*").eq("id", signal_id).execute()
+        client = await cls.get_client()
+        response = await (
+            client.table("signals").select("*").eq("id", signal_id).execute()
+        )
         return response.data[0] if response.data else None
 
+    @classmethod
+    async def get_signals_by_ids(cls, signal_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get several signals by ID in one request."""
+        if not signal_ids:
+            return []
+        client = await cls.get_client()
+        response = await (
+            client.table("signals").select("*").in_("id", signal_ids).execute()
+        )
+        return response.data
+
     # ==================== Trades ====================
 
     @classmethod
-    def create_trade(cls, trade: TradeCreate) -> Trade:
+    async def create_trade(cls, trade: TradeCreate) -> Trade:
         """Create a new trade record."""
-        client = cls.get_client()
+        client = await cls.get_client()
         data = {
             "signal_id": str(trade.signal_id) if trade.signal_id else None,
             "symbol": trade.symbol,
@@ -213,37 +444,43 @@ class DatabaseClient:
             "quantity": float(trade.quantity),
             "stop_loss_price": float(trade.stop_loss_price),
             "take_profit_price": float(trade.take_profit_price),
+            "exchange_order_id": trade.exchange_order_id,
+            "sl_order_id": trade.sl_order_id,
+            "tp_order_id": trade.tp_order_id,
         }
-        response = client.table("trades").insert(data).execute()
-        logger.info(f"Created trade: {trade.side} {trade.symbol}")
+        response = await client.table("trades").insert(data).execute()
+        invalidate_query_cache()
+        logger.info("Created trade: %s %s", trade.side, trade.symbol)
         return Trade(**response.data[0])
 
     @classmethod
-    def get_open_trades(cls) -> List[Dict[str, Any]]:
+    @_ttl_cached(TRADE_CACHE_TTL)
+    async def get_open_trades(cls, columns: str = "*") -> List[Dict[str, Any]]:
         """Get all open trades."""
-        client = cls.get_client()
-        response = (
+        client = await cls.get_client()
+        response = await (
             client.table("trades")
-            .select("*")
+            .select(columns)
             .eq("status", TradeStatus.OPEN.value)
             .execute()
         )
         return response.data
 
     @classmethod
-    def get_open_trades_count(cls) -> int:
+    @_ttl_cached(TRADE_CACHE_TTL)
+    async def get_open_trades_count(cls) -> int:
         """Get count of open trades."""
-        client = cls.get_client()
-        response = (
+        client = await cls.get_client()
+        response = await (
             client.table("trades")
-            .select("id", count="exact")
+            .select("id", count="exact", head=True)
             .eq("status", TradeStatus.OPEN.value)
             .execute()
         )
         return response.count or 0
 
     @classmethod
-    def close_trade(
+    async def close_trade(
         cls,
         trade_id: str,
         exit_price: float,
@@ -252,64 +489,48 @@ class DatabaseClient:
         pnl_percentage: float,
     ) -> None:
         """Close a trade with P&L."""
-        client = cls.get_client()
-        client.table("trades").update(
+        client = await cls.get_client()
+        await client.table("trades").update(
             {
                 "exit_price": exit_price,
                 "status": status.value,
                 "pnl_amount": pnl_amount,
                 "pnl_percentage": pnl_percentage,
-                "closed_at": datetime.utcnow().isoformat(),
+                "closed_at": datetime.now(timezone.utc).isoformat(),
             }
         ).eq("id", trade_id).execute()
-        logger.info(f"Closed trade {trade_id}: {status.value} P&L: {pnl_percentage:.2f}%")
-
-    @classmethod
-    def update_trade_order_ids(
-        cls,
-        trade_id: str,
-        exchange_order_id: Optional[str] = None,
-        sl_order_id: Optional[str] = None,
-        tp_order_id: Optional[str] = None,
-    ) -> None:
-        """Update trade with exchange order IDs."""
-        client = cls.get_client()
-        data = {}
-        if exchange_order_id:
-            data["exchange_order_id"] = exchange_order_id
-        if sl_order_id:
-            data["sl_order_id"] = sl_order_id
-        if tp_order_id:
-            data["tp_order_id"] = tp_order_id
-
-        if data:
-            client.table("trades").update(data).eq("id", trade_id).execute()
+        invalidate_query_cache()
+        logger.info(
+            "Closed trade %s: %s P&L: %.2f%%", trade_id, status.value, pnl_percentage
+        )
 
     # ==================== Portfolio ====================
 
     @classmethod
-    def update_portfolio(
+    async def update_portfolio(
         cls,
         total_balance: float,
         available_balance: float,
         locked_balance: float = 0,
     ) -> None:
         """Insert new portfolio snapshot."""
-        client = cls.get_client()
-        client.table("portfolio").insert(
+        client = await cls.get_client()
+        await client.table("portfolio").insert(
             {
                 "total_balance": total_balance,
                 "available_balance": available_balance,
                 "locked_balance": locked_balance,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
             }
         ).execute()
+        invalidate_query_cache()
 
     @classmethod
-    def get_latest_portfolio(cls) -> Optional[Dict[str, Any]]:
+    @_ttl_cached(PORTFOLIO_CACHE_TTL)
+    async def get_latest_portfolio(cls) -> Optional[Dict[str, Any]]:
         """Get most recent portfolio balance."""
-        client = cls.get_client()
-        response = (
+        client = await cls.get_client()
+        response = await (
             client.table("portfolio")
             .select("*")
             .order("timestamp", desc=True)
@@ -317,3 +538,13 @@ class DatabaseClient:
             .execute()
         )
         return response.data[0] if response.data else None
+
+    # ==================== Status ====================
+
+    @classmethod
+    @_ttl_cached(SIGNAL_CACHE_TTL)
+    async def get_status_summary(cls) -> Dict[str, Any]:
+        """Get open trade and pending signal counts plus latest portfolio."""
+        client = await cls.get_client()
+        response = await client.rpc("bot_status_summary").execute()
+        return response.data
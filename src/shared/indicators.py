@@ -2,49 +2,63 @@
 Technical analysis indicator calculations.
 """
 
+import math
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
+from scipy.signal import lfilter
 
+from .indicators_nb import all_indicators as _all_indicators_nb
+from .jit import NUMBA_AVAILABLE
 from .models import TechnicalIndicators
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+PriceSeries = Union[List[float], np.ndarray]
 
-def calculate_sma(prices: List[float], period: int) -> Optional[float]:
+
+def _as_array(prices: PriceSeries) -> np.ndarray:
+    """Convert prices to a float64 array without copying arrays."""
+    return np.asarray(prices, dtype=np.float64)
+
+
+def _ema_series(prices: np.ndarray, period: int) -> np.ndarray:
+    """Calculate the EMA at every index, seeded with the first price."""
+    alpha = 2 / (period + 1)
+    series = np.empty_like(prices)
+    series[0] = prices[0]
+    if len(prices) > 1:
+        # y[n] = alpha * x[n] + (1 - alpha) * y[n - 1], with y[-1] = prices[0]
+        series[1:], _ = lfilter(
+            [alpha], [1, alpha - 1], prices[1:], zi=[(1 - alpha) * prices[0]]
+        )
+    return series
+
+
+def calculate_sma(prices: PriceSeries, period: int) -> Optional[float]:
     """Calculate Simple Moving Average."""
     if len(prices) < period:
         return None
-    return float(np.mean(prices[-period:]))
+    return float(np.mean(_as_array(prices)[-period:]))
 
 
-def calculate_ema(prices: List[float], period: int) -> Optional[float]:
+def calculate_ema(prices: PriceSeries, period: int) -> Optional[float]:
     """Calculate Exponential Moving Average."""
     if len(prices) < period:
         return None
+    return float(_ema_series(_as_array(prices), period)[-1])
 
-    multiplier = 2 / (period + 1)
-    ema = prices[0]
-
-    for price in prices[1:]:
-        ema = (price * multiplier) + (ema * (1 - multiplier))
-
-    return float(ema)
 
-
-def calculate_rsi(prices: List[float], period: int = 14) -> Optional[float]:
+def calculate_rsi(prices: PriceSeries, period: int = 14) -> Optional[float]:
     """Calculate Relative Strength Index."""
     if len(prices) < period + 1:
         return None
 
-    deltas = np.diff(prices)
-    gains = np.where(deltas > 0, deltas, 0)
-    losses = np.where(deltas < 0, -deltas, 0)
-
-    avg_gain = np.mean(gains[-period:])
-    avg_loss = np.mean(losses[-period:])
+    deltas = np.diff(_as_array(prices)[-(period + 1):])
+    avg_gain = np.mean(np.maximum(deltas, 0))
+    avg_loss = np.mean(np.maximum(-deltas, 0))
 
     if avg_loss == 0:
         return 100.0
@@ -56,7 +70,7 @@ def calculate_rsi(prices: List[float], period: int = 14) -> Optional[float]:
 
 
 def calculate_macd(
-    prices: List[float],
+    prices: PriceSeries,
     fast_period: int = 12,
     slow_period: int = 26,
     signal_period: int = 9
@@ -65,33 +79,22 @@ def calculate_macd(
     if len(prices) < slow_period + signal_period:
         return None, None, None
 
-    fast_ema = calculate_ema(prices, fast_period)
-    slow_ema = calculate_ema(prices, slow_period)
-
-    if fast_ema is None or slow_ema is None:
-        return None, None, None
+    prices = _as_array(prices)
+    fast_ema = _ema_series(prices, fast_period)
+    slow_ema = _ema_series(prices, slow_period)
 
-    macd_line = fast_ema - slow_ema
+    # MACD series from the first bar with a full slow EMA window
+    macd_values = fast_ema[slow_period - 1:] - slow_ema[slow_period - 1:]
+    macd_line = float(macd_values[-1])
 
-    macd_values = []
-    for i in range(slow_period - 1, len(prices)):
-        subset = prices[:i + 1]
-        fast = calculate_ema(subset, fast_period)
-        slow = calculate_ema(subset, slow_period)
-        if fast and slow:
-            macd_values.append(fast - slow)
-
-    if len(macd_values) < signal_period:
-        return macd_line, None, None
-
-    signal_line = calculate_ema(macd_values, signal_period)
+    signal_line = float(_ema_series(macd_values, signal_period)[-1])
     histogram = macd_line - signal_line if signal_line else None
 
     return macd_line, signal_line, histogram
 
 
 def calculate_bollinger_bands(
-    prices: List[float],
+    prices: PriceSeries,
     period: int = 20,
     std_dev: float = 2.0
 ) -> Tuple[Optional[float], Optional[float], Optional[float]]:
@@ -99,7 +102,7 @@ def calculate_bollinger_bands(
     if len(prices) < period:
         return None, None, None
 
-    recent_prices = prices[-period:]
+    recent_prices = _as_array(prices)[-period:]
     middle_band = float(np.mean(recent_prices))
     std = float(np.std(recent_prices))
 
@@ -111,17 +114,32 @@ def calculate_bollinger_bands(
 
 def calculate_all_indicators(
     symbol: str,
-    prices: List[float],
+    prices: PriceSeries,
     timestamp: datetime
 ) -> TechnicalIndicators:
     """Calculate all technical indicators for a symbol."""
-    current_price = prices[-1] if prices else 0
-
-    rsi = calculate_rsi(prices, 14)
-    sma_20 = calculate_sma(prices, 20)
-    sma_50 = calculate_sma(prices, 50)
-    macd_line, macd_signal, macd_hist = calculate_macd(prices)
-    bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(prices)
+    prices = _as_array(prices)
+    current_price = float(prices[-1]) if len(prices) else 0.0
+
+    if NUMBA_AVAILABLE and len(prices):
+        # Fused native kernel; NaN marks an indicator without enough data
+        (
+            rsi,
+            sma_20,
+            sma_50,
+            macd_line,
+            macd_signal,
+            macd_hist,
+            bb_upper,
+            bb_middle,
+            bb_lower,
+        ) = (None if math.isnan(v) else float(v) for v in _all_indicators_nb(prices))
+    else:
+        rsi = calculate_rsi(prices, 14)
+        sma_20 = calculate_sma(prices, 20)
+        sma_50 = calculate_sma(prices, 50)
+        macd_line, macd_signal, macd_hist = calculate_macd(prices)
+        bb_upper, bb_middle, bb_lower = calculate_bollinger_bands(prices)
 
     indicators = TechnicalIndicators(
         symbol=symbol,
@@ -138,5 +156,5 @@ def calculate_all_indicators(
         current_price=current_price
     )
 
-    logger.debug(f"Indicators for {symbol}: RSI={rsi}, SMA20={sma_20}")
+    logger.debug("Indicators for %s: RSI=%s, SMA20=%s", symbol, rsi, sma_20)
     return indicators
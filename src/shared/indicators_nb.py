@@ -0,0 +1,135 @@
+"""
+Numba-compiled indicator kernels.
+
+Each kernel mirrors the NumPy implementation in indicators.py and reports
+missing values as NaN. Without Numba installed they run as plain Python.
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+from .jit import njit, NUMBA_AVAILABLE
+
+# Fast-math without "nnan"/"ninf": the kernels use NaN as their missing-value
+# sentinel, and LLVM treats NaN as undefined behaviour under those flags
+_FASTMATH = {"contract", "arcp", "reassoc"}
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _ema_nb(prices: np.ndarray, period: int) -> float:
+    """EMA of the full series, seeded with the first price."""
+    if len(prices) < period:
+        return math.nan
+    alpha = 2.0 / (period + 1)
+    ema = prices[0]
+    for i in range(1, len(prices)):
+        ema = prices[i] * alpha + ema * (1.0 - alpha)
+    return ema
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _rsi_nb(prices: np.ndarray, period: int) -> float:
+    """RSI from the simple mean of the last `period` gains and losses."""
+    n = len(prices)
+    if n < period + 1:
+        return math.nan
+    gains = 0.0
+    losses = 0.0
+    for i in range(n - period, n):
+        delta = prices[i] - prices[i - 1]
+        if delta > 0:
+            gains += delta
+        else:
+            losses -= delta
+    if losses == 0:
+        return 100.0
+    rs = gains / losses
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _macd_nb(
+    prices: np.ndarray, fast_period: int, slow_period: int, signal_period: int
+) -> Tuple[float, float]:
+    """MACD line and signal line in a single pass."""
+    n = len(prices)
+    if n < slow_period + signal_period:
+        return math.nan, math.nan
+    fast_alpha = 2.0 / (fast_period + 1)
+    slow_alpha = 2.0 / (slow_period + 1)
+    signal_alpha = 2.0 / (signal_period + 1)
+
+    fast = prices[0]
+    slow = prices[0]
+    macd = 0.0
+    signal = 0.0
+    for i in range(n):
+        if i > 0:
+            fast = prices[i] * fast_alpha + fast * (1.0 - fast_alpha)
+            slow = prices[i] * slow_alpha + slow * (1.0 - slow_alpha)
+        if i >= slow_period - 1:
+            macd = fast - slow
+            if i == slow_period - 1:
+                signal = macd
+            else:
+                signal = macd * signal_alpha + signal * (1.0 - signal_alpha)
+    return macd, signal
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _mean_std_nb(prices: np.ndarray, period: int) -> Tuple[float, float]:
+    """Mean and population standard deviation of the last `period` prices."""
+    n = len(prices)
+    if n < period:
+        return math.nan, math.nan
+    total = 0.0
+    for i in range(n - period, n):
+        total += prices[i]
+    mean = total / period
+    squares = 0.0
+    for i in range(n - period, n):
+        squares += (prices[i] - mean) ** 2
+    return mean, math.sqrt(squares / period)
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _all_indicators(prices: np.ndarray) -> Tuple[
+    float, float, float, float, float, float, float, float, float
+]:
+    """Compute every indicator in one call.
+
+    Returns (rsi_14, sma_20, sma_50, macd_line, macd_signal, macd_histogram,
+    bb_upper, bb_middle, bb_lower).
+    """
+    rsi = _rsi_nb(prices, 14)
+    sma_20, std_20 = _mean_std_nb(prices, 20)
+    sma_50, _ = _mean_std_nb(prices, 50)
+    macd_line, macd_signal = _macd_nb(prices, 12, 26, 9)
+
+    macd_histogram = math.nan
+    if macd_signal != 0:
+        macd_histogram = macd_line - macd_signal
+
+    return (
+        rsi,
+        sma_20,
+        sma_50,
+        macd_line,
+        macd_signal,
+        macd_histogram,
+        sma_20 + 2.0 * std_20,
+        sma_20,
+        sma_20 - 2.0 * std_20,
+    )
+
+
+def all_indicators(prices: np.ndarray) -> Tuple[float, ...]:
+    """Run the fused kernel on a contiguous float64 copy of prices."""
+    return _all_indicators(np.ascontiguousarray(prices, dtype=np.float64))
+
+
+if NUMBA_AVAILABLE:
+    # Load (or compile) the cached kernels up front rather than on first tick
+    all_indicators(np.zeros(1))
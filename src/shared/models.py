@@ -2,13 +2,19 @@
 Pydantic models and enums.
 """
 
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import Annotated, Optional, Dict, Any, List
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PlainSerializer
+
+# Decimal that serializes as a JSON number rather than a string
+FloatDecimal = Annotated[
+    Decimal, PlainSerializer(float, return_type=float, when_used="json")
+]
 
 
 class SignalType(str, Enum):
@@ -41,17 +47,11 @@ class OHLCVCandle(BaseModel):
     symbol: str
     timeframe: str = "15m"
     timestamp: datetime
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
-    volume: Decimal
-
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v),
-            datetime: lambda v: v.isoformat()
-        }
+    open: FloatDecimal
+    high: FloatDecimal
+    low: FloatDecimal
+    close: FloatDecimal
+    volume: FloatDecimal
 
 
 class SentimentData(BaseModel):
@@ -64,7 +64,8 @@ class SentimentData(BaseModel):
     raw_data: Optional[Dict[str, Any]] = None
 
 
-class TechnicalIndicators(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class TechnicalIndicators:
     """Calculated technical indicators."""
     symbol: str
     timestamp: datetime
@@ -113,6 +114,9 @@ class TradeCreate(BaseModel):
     quantity: Decimal
     stop_loss_price: Decimal
     take_profit_price: Decimal
+    exchange_order_id: Optional[str] = None
+    sl_order_id: Optional[str] = None
+    tp_order_id: Optional[str] = None
 
 
 class Trade(TradeCreate):
@@ -122,9 +126,6 @@ class Trade(TradeCreate):
     status: TradeStatus = TradeStatus.OPEN
     pnl_amount: Optional[Decimal] = None
     pnl_percentage: Optional[Decimal] = None
-    exchange_order_id: Optional[str] = None
-    sl_order_id: Optional[str] = None
-    tp_order_id: Optional[str] = None
     opened_at: datetime
     closed_at: Optional[datetime] = None
 
@@ -2,12 +2,15 @@
 Telegram command and callback handlers.
 """
 
+import asyncio
+
 from telegram import Update
 from telegram.ext import ContextTypes
 
 from src.shared.db import DatabaseClient
 from src.shared.models import SignalStatus
 from src.shared.logger import get_logger
+from .keyboards import SIGNAL_CALLBACK_RE
 
 logger = get_logger(__name__)
 
@@ -28,16 +31,15 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /status command."""
     try:
-        open_trades = DatabaseClient.get_open_trades()
-        pending_signals = DatabaseClient.get_pending_signals()
-        portfolio = DatabaseClient.get_latest_portfolio()
+        summary = await DatabaseClient.get_status_summary()
+        portfolio = summary["portfolio"]
 
         balance = f"${float(portfolio['total_balance']):,.2f}" if portfolio else "N/A"
 
         await update.message.reply_text(
             f"<b>Bot Status</b>\n\n"
-            f"<b>Open Positions:</b> {len(open_trades)}\n"
-            f"<b>Pending Signals:</b> {len(pending_signals)}\n"
+            f"<b>Open Positions:</b> {summary['open_trades']}\n"
+            f"<b>Pending Signals:</b> {summary['pending_signals']}\n"
             f"<b>Portfolio Balance:</b> {balance}\n",
             parse_mode="HTML",
         )
@@ -51,8 +53,10 @@ async def portfolio_command(
 ) -> None:
     """Handle /portfolio command."""
     try:
-        portfolio = DatabaseClient.get_latest_portfolio()
-        open_trades = DatabaseClient.get_open_trades()
+        portfolio, open_trades = await asyncio.gather(
+            DatabaseClient.get_latest_portfolio(),
+            DatabaseClient.get_open_trades(columns="symbol,side,entry_price"),
+        )
 
         if not portfolio:
             await update.message.reply_text("No portfolio data available.")
@@ -84,7 +88,9 @@ async def portfolio_command(
 async def signals_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /signals command."""
     try:
-        pending = DatabaseClient.get_pending_signals()
+        pending = await DatabaseClient.get_pending_signals(
+            columns="symbol,signal_type,entry_price,confidence"
+        )
 
         if not pending:
             await update.message.reply_text("No pending signals.")
@@ -115,42 +121,26 @@ async def handle_signal_callback(
     await query.answer()
 
     try:
-        parts = query.data.split("_")
-        if len(parts) != 3:
+        match = SIGNAL_CALLBACK_RE.match(query.data)
+        if not match:
             logger.error(f"Invalid callback data: {query.data}")
             return
 
-        _, action, signal_id = parts
+        action, signal_id = match.groups()
         username = update.effective_user.username or str(update.effective_user.id)
+        status = SignalStatus.APPROVED if action == "approve" else SignalStatus.REJECTED
 
-        if action == "approve":
-            DatabaseClient.update_signal_status(
-                signal_id=signal_id,
-                status=SignalStatus.APPROVED,
-                approved_by=username,
-            )
-
-            await query.edit_message_text(
-                text=query.message.text + f"\n\n<b>APPROVED</b> by @{username}",
-                parse_mode="HTML",
-            )
-            logger.info(f"Signal {signal_id} approved by {username}")
-
-        elif action == "reject":
-            DatabaseClient.update_signal_status(
-                signal_id=signal_id,
-                status=SignalStatus.REJECTED,
-                approved_by=username,
-            )
-
-            await query.edit_message_text(
-                text=query.message.text + f"\n\n<b>REJECTED</b> by @{username}",
-                parse_mode="HTML",
-            )
-            logger.info(f"Signal {signal_id} rejected by {username}")
+        await DatabaseClient.update_signal_status(
+            signal_id=signal_id,
+            status=status,
+            approved_by=username,
+        )
 
-        else:
-            logger.warning(f"Unknown callback action: {action}")
+        await query.edit_message_text(
+            text=query.message.text + f"\n\n<b>{status.value}</b> by @{username}",
+            parse_mode="HTML",
+        )
+        logger.info(f"Signal {signal_id} {status.value.lower()} by {username}")
 
     except Exception as e:
         logger.error(f"Callback handling error: {e}", exc_info=True)
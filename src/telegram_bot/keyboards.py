@@ -2,8 +2,13 @@
 Telegram InlineKeyboard builders.
 """
 
+import re
+
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
+# Matches the callback_data built below: signal_<action>_<uuid>
+SIGNAL_CALLBACK_RE = re.compile(r"^signal_(approve|reject)_([0-9a-f-]{36})$")
+
 
 def create_signal_keyboard(signal_id: str) -> InlineKeyboardMarkup:
     """Create approve/reject keyboard for a signal."""
@@ -4,7 +4,7 @@ Runs as a long-running process.
 """
 
 import asyncio
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set
 
 from telegram import Update
 from telegram.ext import (
@@ -24,24 +24,53 @@ from .handlers import (
     signals_command,
     handle_signal_callback,
 )
-from .keyboards import create_signal_keyboard
+from .keyboards import create_signal_keyboard, SIGNAL_CALLBACK_RE
 
 logger = get_logger(__name__)
 
+# Polling cadence without Realtime, and the reconciliation sweep with it
+POLL_INTERVAL = 60
+RECONCILE_INTERVAL = 300
+
+# Pooled HTTP/2 connections for concurrent Bot API calls
+TELEGRAM_POOL_SIZE = 20
+# Notifications in flight at once, under Telegram's ~30 msg/s global limit
+NOTIFY_CONCURRENCY = 20
+
+_SIGNAL_MESSAGE = """
+<b>NEW TRADING SIGNAL</b>
+
+<b>Symbol:</b> {symbol}
+<b>Type:</b> {signal_type}
+<b>Confidence:</b> {confidence}%
+
+<b>Entry Price:</b> ${entry_price:,.2f}
+<b>Stop Loss:</b> ${stop_loss_price:,.2f}
+<b>Take Profit:</b> ${take_profit_price:,.2f}
+
+<b>Technical Indicators:</b>
+RSI: {rsi}
+MACD: {macd}
+BB Position: {bb_position}
+
+<b>Analysis:</b>
+{analysis_summary}
+
+<i>Expires: {expires_at}</i>
+"""
+
 
 class TelegramBotService:
     """Telegram bot service for signal notifications and approvals."""
 
     def __init__(self):
         self.application: Optional[Application] = None
-        self.check_interval = 60
-
-    async def send_signal_notification(self, signal: dict) -> None:
-        """Send a signal notification with approve/reject buttons."""
-        if not self.application:
-            logger.error("Application not initialized")
-            return
+        self.check_interval = POLL_INTERVAL
+        self._notifying: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
 
+    async def _send_signal_message(self, signal: dict) -> Optional[int]:
+        """Send a signal message with approve/reject buttons, returning its id."""
         message = self._format_signal_message(signal)
         keyboard = create_signal_keyboard(signal["id"])
 
@@ -52,54 +81,121 @@ class TelegramBotService:
                 reply_markup=keyboard,
                 parse_mode="HTML",
             )
-
-            DatabaseClient.update_signal_status(
-                signal_id=signal["id"],
-                status=SignalStatus.PENDING,
-                telegram_message_id=sent_message.message_id,
-            )
-
             logger.info(f"Sent signal notification: {signal['id']}")
+            return sent_message.message_id
 
         except Exception as e:
             logger.error(f"Failed to send notification: {e}")
+            return None
 
-    def _format_signal_message(self, signal: dict) -> str:
-        """Format signal data as Telegram message."""
-        signal_type = signal["signal_type"]
-        technical = signal.get("technical_data", {}) or {}
+    async def send_signal_notification(self, signal: dict) -> None:
+        """Send a signal notification and record its Telegram message id."""
+        if not self.application:
+            logger.error("Application not initialized")
+            return
+        if signal["id"] in self._notifying:
+            return
+        self._notifying.add(signal["id"])
 
-        return f"""
-<b>NEW TRADING SIGNAL</b>
+        try:
+            message_id = await self._send_signal_message(signal)
+            if message_id:
+                await DatabaseClient.update_signal_status(
+                    signal_id=signal["id"],
+                    status=SignalStatus.PENDING,
+                    telegram_message_id=message_id,
+                )
+        except Exception as e:
+            logger.error(f"Failed to record notification: {e}")
+        finally:
+            self._notifying.discard(signal["id"])
 
-<b>Symbol:</b> {signal['symbol']}
-<b>Type:</b> {signal_type}
-<b>Confidence:</b> {signal['confidence']}%
+    async def notify_signals(self, signal_ids: List[str]) -> None:
+        """Notify several signals concurrently, recording ids in one update."""
+        if not self.application:
+            logger.error("Application not initialized")
+            return
+        signal_ids = [i for i in signal_ids if i not in self._notifying]
+        if not signal_ids:
+            return
+        self._notifying.update(signal_ids)
+        semaphore = asyncio.Semaphore(NOTIFY_CONCURRENCY)
 
-<b>Entry Price:</b> ${float(signal['entry_price']):,.2f}
-<b>Stop Loss:</b> ${float(signal['stop_loss_price']):,.2f}
-<b>Take Profit:</b> ${float(signal['take_profit_price']):,.2f}
+        async def send(signal: dict) -> Optional[int]:
+            async with semaphore:
+                return await self._send_signal_message(signal)
 
-<b>Technical Indicators:</b>
-RSI: {technical.get('rsi', 'N/A')}
-MACD: {technical.get('macd', 'N/A')}
-BB Position: {technical.get('bb_position', 'N/A')}
+        try:
+            signals = await DatabaseClient.get_signals_by_ids(signal_ids)
+            results = await asyncio.gather(
+                *(send(s) for s in signals), return_exceptions=True
+            )
+            message_ids = {}
+            for signal, result in zip(signals, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to notify signal {signal['id']}: {result}")
+                elif result:
+                    message_ids[signal["id"]] = result
+            if message_ids:
+                await DatabaseClient.set_signal_message_ids(message_ids)
+        finally:
+            self._notifying.difference_update(signal_ids)
 
-<b>Analysis:</b>
-{signal.get('analysis_summary', 'No analysis available')}
+    def _format_signal_message(self, signal: dict) -> str:
+        """Format signal data as Telegram message."""
+        technical = signal.get("technical_data", {}) or {}
 
-<i>Expires: {signal.get('expires_at', 'N/A')}</i>
-"""
+        return _SIGNAL_MESSAGE.format_map(
+            {
+                "symbol": signal["symbol"],
+                "signal_type": signal["signal_type"],
+                "confidence": signal["confidence"],
+                "entry_price": float(signal["entry_price"]),
+                "stop_loss_price": float(signal["stop_loss_price"]),
+                "take_profit_price": float(signal["take_profit_price"]),
+                "rsi": technical.get("rsi", "N/A"),
+                "macd": technical.get("macd", "N/A"),
+                "bb_position": technical.get("bb_position", "N/A"),
+                "analysis_summary": signal.get(
+                    "analysis_summary", "No analysis available"
+                ),
+                "expires_at": signal.get("expires_at", "N/A"),
+            }
+        )
+
+    def _on_new_signal(self, payload: Dict[str, Any]) -> None:
+        """Realtime callback: notify about a freshly inserted signal."""
+        signal = payload["data"].get("record")
+        if not signal or signal.get("telegram_message_id"):
+            return
+        if signal.get("status") != SignalStatus.PENDING.value:
+            return
+        task = asyncio.create_task(self.send_signal_notification(signal))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def subscribe_new_signals(self) -> None:
+        """Push new signals via Realtime, polling only to reconcile misses."""
+        try:
+            await DatabaseClient.subscribe_signal_inserts(self._on_new_signal)
+            self.check_interval = RECONCILE_INTERVAL
+            logger.info("Subscribed to signal inserts via Realtime")
+        except Exception as e:
+            logger.warning(f"Realtime subscription failed, polling instead: {e}")
 
     async def check_pending_signals(self) -> None:
-        """Periodically check for new pending signals to notify."""
+        """Periodically check for pending signals that were not notified."""
         while True:
             try:
-                pending_signals = DatabaseClient.get_pending_signals()
+                pending_signals = await DatabaseClient.get_pending_signals(
+                    columns="id,telegram_message_id"
+                )
 
-                for signal in pending_signals:
-                    if not signal.get("telegram_message_id"):
-                        await self.send_signal_notification(signal)
+                unsent = [
+                    s["id"] for s in pending_signals if not s.get("telegram_message_id")
+                ]
+                if unsent:
+                    await self.notify_signals(unsent)
 
             except Exception as e:
                 logger.error(f"Error checking pending signals: {e}")
@@ -110,14 +206,20 @@ BB Position: {technical.get('bb_position', 'N/A')}
         """Start the Telegram bot."""
         logger.info("Starting Telegram bot...")
 
-        self.application = Application.builder().token(API.TELEGRAM_BOT_TOKEN).build()
+        self.application = (
+            Application.builder()
+            .token(API.TELEGRAM_BOT_TOKEN)
+            .connection_pool_size(TELEGRAM_POOL_SIZE)
+            .http_version("2")
+            .build()
+        )
 
         self.application.add_handler(CommandHandler("start", start_command))
         self.application.add_handler(CommandHandler("status", status_command))
         self.application.add_handler(CommandHandler("portfolio", portfolio_command))
         self.application.add_handler(CommandHandler("signals", signals_command))
         self.application.add_handler(
-            CallbackQueryHandler(handle_signal_callback, pattern="^signal_")
+            CallbackQueryHandler(handle_signal_callback, pattern=SIGNAL_CALLBACK_RE)
         )
 
         await self.application.initialize()
@@ -126,7 +228,11 @@ BB Position: {technical.get('bb_position', 'N/A')}
 
         logger.info("Telegram bot started successfully")
 
-        await self.check_pending_signals()
+        try:
+            await self.subscribe_new_signals()
+            await self.check_pending_signals()
+        finally:
+            await DatabaseClient.close()
 
 
 def main() -> None:
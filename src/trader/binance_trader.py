@@ -2,8 +2,19 @@
 Binance trading client using CCXT.
 """
 
-from typing import Optional, Dict, Any
+import asyncio
+import json
+import os
+import random
+import socket
+import ssl
+import time
+import uuid
+from pathlib import Path
+from typing import Optional, Dict, Any, List
 
+import aiohttp
+import certifi
 import ccxt.async_support as ccxt
 
 from src.shared.config import API
@@ -11,20 +22,47 @@ from src.shared.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Keep TLS connections to Binance open across requests instead of
+# re-handshaking; ccxt's default connector closes idle sockets after 15 s
+KEEPALIVE_TIMEOUT = 75
+DNS_CACHE_TTL = 300
+# Seconds a fetched balance is reused; orders invalidate it immediately
+BALANCE_CACHE_TTL = 2.0
+# Orders failing with a network error are retried with full-jitter backoff,
+# but only once Binance is known not to hold the earlier attempt
+ORDER_ATTEMPTS = 3
+ORDER_BACKOFF_BASE = 0.2
+ORDER_BACKOFF_MAX = 2.0
+# Causes of ccxt.NetworkError raised before the request left this host
+_UNSENT_ERRORS = (socket.gaierror, aiohttp.ClientConnectorError)
+# Markets are cached on disk so cron runs skip the ~1 MB exchangeInfo call
+MARKETS_CACHE_DIR = Path(".cache")
+MARKETS_CACHE_TTL = 24 * 60 * 60
 
-class BinanceTrader:
-    """CCXT Binance trading client."""
+_session: Optional[aiohttp.ClientSession] = None
+_exchange: Optional[ccxt.binance] = None
+# Markets survive exchange restarts so load_markets runs once per process
+_markets: Optional[Dict[str, Any]] = None
 
-    def __init__(self):
-        self.exchange: Optional[ccxt.binance] = None
 
-    async def initialize(self) -> None:
-        """Initialize the exchange connection."""
-        self.exchange = ccxt.binance(
+def _get_exchange() -> ccxt.binance:
+    """Get or create the shared Binance trading exchange client."""
+    global _exchange, _session
+    if _exchange is None:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                ssl=ssl.create_default_context(cafile=certifi.where()),
+                limit=100,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            )
+        )
+        _exchange = ccxt.binance(
             {
                 "apiKey": API.BINANCE_API_KEY,
                 "secret": API.BINANCE_SECRET,
                 "enableRateLimit": True,
+                "session": _session,
                 "options": {
                     "defaultType": "spot",
                 },
@@ -32,36 +70,161 @@ class BinanceTrader:
         )
 
         if API.BINANCE_TESTNET:
-            self.exchange.set_sandbox_mode(True)
+            _exchange.set_sandbox_mode(True)
             logger.info("Using Binance TESTNET")
 
-        await self.exchange.load_markets()
+        if _markets is not None:
+            _exchange.set_markets(_markets)
+    return _exchange
+
+
+def _markets_cache_path() -> Path:
+    """Markets cache file, kept apart for testnet and live markets."""
+    suffix = "testnet" if API.BINANCE_TESTNET else "live"
+    return MARKETS_CACHE_DIR / f"binance_markets_{suffix}.json"
+
+
+def _read_markets_cache() -> Optional[Dict[str, Any]]:
+    """Return cached markets if the cache file is fresh."""
+    path = _markets_cache_path()
+    try:
+        if time.time() - path.stat().st_mtime > MARKETS_CACHE_TTL:
+            return None
+        return json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable markets cache {path}: {e}")
+        return None
+
+
+def _write_markets_cache(markets: Dict[str, Any]) -> None:
+    """Save markets for later runs; failures only cost a reload."""
+    path = _markets_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(markets, default=str))
+        os.replace(tmp, path)
+    except Exception as e:
+        logger.warning(f"Failed to write markets cache {path}: {e}")
+
+
+async def close_exchange() -> None:
+    """Close the shared Binance trading exchange client and its session."""
+    global _exchange, _session
+    if _exchange is not None:
+        await _exchange.close()
+        _exchange = None
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
+class BinanceTrader:
+    """CCXT Binance trading client."""
+
+    def __init__(self):
+        self.exchange: Optional[ccxt.binance] = None
+        self._balance: Optional[Dict[str, Any]] = None
+        self._balance_at = 0.0
+
+    async def initialize(self) -> None:
+        """Initialize the exchange connection."""
+        global _markets
+        self.exchange = _get_exchange()
+
+        if not self.exchange.markets:
+            _markets = _read_markets_cache()
+            if _markets is not None:
+                self.exchange.set_markets(_markets)
+            else:
+                _markets = await self.exchange.load_markets()
+                _write_markets_cache(_markets)
         logger.info("Exchange initialized")
 
     async def close(self) -> None:
         """Close exchange connection."""
         if self.exchange:
-            await self.exchange.close()
+            await close_exchange()
+            self.exchange = None
 
-    async def get_balance(self, asset: str = "USDT") -> float:
-        """Get available balance for an asset."""
+    async def fetch_balance(self) -> Dict[str, Any]:
+        """Get the full account balance, reusing a recent response."""
         if not self.exchange:
             raise RuntimeError("Exchange not initialized")
 
-        balance = await self.exchange.fetch_balance()
+        now = time.monotonic()
+        if self._balance is None or now - self._balance_at > BALANCE_CACHE_TTL:
+            self._balance = await self.exchange.fetch_balance()
+            self._balance_at = now
+        return self._balance
+
+    async def get_balance(self, asset: str = "USDT") -> float:
+        """Get available balance for an asset."""
+        balance = await self.fetch_balance()
         return float(balance.get(asset, {}).get("free", 0))
 
-    async def get_current_price(self, symbol: str) -> Optional[float]:
-        """Get current price for a symbol."""
-        if not self.exchange:
+    async def _create_order(self, **kwargs: Any) -> Dict[str, Any]:
+        """Place an order, retrying failures it can prove are safe to resend."""
+        client_order_id = uuid.uuid4().hex
+        kwargs["params"] = {
+            **kwargs.get("params", {}),
+            "clientOrderId": client_order_id,
+        }
+        try:
+            for attempt in range(ORDER_ATTEMPTS):
+                try:
+                    return await self.exchange.create_order(**kwargs)
+                except ccxt.NetworkError as e:
+                    if attempt == ORDER_ATTEMPTS - 1:
+                        raise
+                    if not isinstance(e.__cause__, _UNSENT_ERRORS):
+                        # The request may have reached Binance; a filled
+                        # market order is no longer open, so a resend with
+                        # the same client id would fill again
+                        order = await self._find_order(
+                            kwargs["symbol"], client_order_id
+                        )
+                        if order is not None:
+                            return order
+                    delay = random.uniform(
+                        0, min(ORDER_BACKOFF_MAX, ORDER_BACKOFF_BASE * 2**attempt)
+                    )
+                    logger.warning(
+                        f"Order attempt {attempt + 1} failed: {e}; "
+                        f"retrying in {delay:.2f}s"
+                    )
+                    await asyncio.sleep(delay)
+        finally:
+            self._balance = None
+
+    async def _find_order(
+        self, symbol: str, client_order_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Look up an order by client id; None only if Binance has no such order."""
+        try:
+            return await self.exchange.fetch_order(
+                None, symbol, params={"origClientOrderId": client_order_id}
+            )
+        except ccxt.OrderNotFound:
             return None
 
+    async def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Get current prices for several symbols in one request."""
+        if not self.exchange or not symbols:
+            return {}
+
         try:
-            ticker = await self.exchange.fetch_ticker(symbol)
-            return float(ticker["last"])
+            tickers = await self.exchange.fetch_tickers(symbols)
+            return {
+                symbol: float(ticker["last"])
+                for symbol, ticker in tickers.items()
+                if ticker.get("last") is not None
+            }
         except Exception as e:
-            logger.error(f"Failed to get price for {symbol}: {e}")
-            return None
+            logger.error(f"Failed to get prices for {symbols}: {e}")
+            return {}
 
     async def create_market_order(
         self, symbol: str, side: str, amount: float
@@ -71,7 +234,7 @@ class BinanceTrader:
             return None
 
         try:
-            order = await self.exchange.create_order(
+            order = await self._create_order(
                 symbol=symbol,
                 type="market",
                 side=side.lower(),
@@ -91,7 +254,7 @@ class BinanceTrader:
             return None
 
         try:
-            order = await self.exchange.create_order(
+            order = await self._create_order(
                 symbol=symbol,
                 type="stop_loss_limit",
                 side=side.lower(),
@@ -113,7 +276,7 @@ class BinanceTrader:
             return None
 
         try:
-            order = await self.exchange.create_order(
+            order = await self._create_order(
                 symbol=symbol,
                 type="take_profit_limit",
                 side=side.lower(),
@@ -132,3 +295,9 @@ class BinanceTrader:
         if not self.exchange:
             return str(amount)
         return self.exchange.amount_to_precision(symbol, amount)
+
+    def get_price_precision(self, symbol: str, price: float) -> str:
+        """Round price to the exchange tick size."""
+        if not self.exchange:
+            return str(price)
+        return self.exchange.price_to_precision(symbol, price)
@@ -2,8 +2,9 @@
 Trade execution logic.
 """
 
+import asyncio
 from decimal import Decimal
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from src.shared.config import TRADING
 from src.shared.db import DatabaseClient
@@ -13,12 +14,20 @@ from .binance_trader import BinanceTrader
 
 logger = get_logger(__name__)
 
+_RISK_PER_TRADE = Decimal(str(TRADING.RISK_PER_TRADE))
+# Share of the USDT balance a single position may take, leaving room for fees
+_MAX_BALANCE_USE = Decimal("0.95")
+
 
 class TradeExecutor:
     """Handles trade execution on Binance testnet."""
 
     def __init__(self):
         self.trader = BinanceTrader()
+        # Serializes entries so concurrent signals size positions against
+        # the balance left by the previous fill
+        self._entry_lock = asyncio.Lock()
+        self._usdt_available: Optional[Decimal] = None
 
     async def initialize(self) -> None:
         """Initialize the trading client."""
@@ -28,92 +37,118 @@ class TradeExecutor:
         """Close connections."""
         await self.trader.close()
 
+    async def snapshot_balance(self) -> None:
+        """Fetch the USDT balance once for the signals about to execute."""
+        self._usdt_available = Decimal(str(await self.trader.get_balance("USDT")))
+
     async def execute_signal(self, signal: Dict[str, Any]) -> bool:
         """Execute a trading signal."""
         symbol = signal["symbol"]
         side = signal["signal_type"]
-        entry_price = float(signal["entry_price"])
-        stop_loss_price = float(signal["stop_loss_price"])
-        take_profit_price = float(signal["take_profit_price"])
+        # Prices stay Decimal; floats are only produced for CCXT calls
+        entry_price = Decimal(str(signal["entry_price"]))
+        stop_loss_price = Decimal(str(signal["stop_loss_price"]))
+        take_profit_price = Decimal(str(signal["take_profit_price"]))
 
         try:
-            # Get current balance
-            usdt_balance = await self.trader.get_balance("USDT")
-
-            # Calculate position size (2% risk)
-            risk_amount = usdt_balance * TRADING.RISK_PER_TRADE
-
-            # Calculate quantity based on stop loss distance
-            sl_distance = abs(entry_price - stop_loss_price)
-            if sl_distance == 0:
-                logger.error("Invalid stop loss distance")
-                return False
-
-            quantity = risk_amount / sl_distance
-
-            # Ensure we have enough balance
-            position_value = quantity * entry_price
-            if position_value > usdt_balance * 0.95:
-                quantity = (usdt_balance * 0.95) / entry_price
-
-            # Round to exchange precision
-            quantity = float(self.trader.get_amount_precision(symbol, quantity))
-
-            logger.info(
-                f"Executing {side} {symbol}: "
-                f"qty={quantity}, entry={entry_price}, "
-                f"sl={stop_loss_price}, tp={take_profit_price}"
-            )
-
-            # 1. Place main order
-            main_order = await self.trader.create_market_order(
-                symbol=symbol, side=side.lower(), amount=quantity
-            )
-
-            if not main_order:
-                logger.error("Failed to execute main order")
-                return False
-
-            actual_entry = float(main_order.get("average", entry_price))
-
-            # 2. Place stop loss order
+            async with self._entry_lock:
+                # Use the cycle's balance snapshot, less earlier fills
+                if self._usdt_available is None:
+                    await self.snapshot_balance()
+                usdt_balance = self._usdt_available
+
+                # Calculate position size (2% risk)
+                risk_amount = usdt_balance * _RISK_PER_TRADE
+
+                # Calculate quantity based on stop loss distance
+                sl_distance = abs(entry_price - stop_loss_price)
+                if sl_distance == 0:
+                    logger.error("Invalid stop loss distance")
+                    return False
+
+                quantity = risk_amount / sl_distance
+
+                # Ensure we have enough balance
+                max_position_value = usdt_balance * _MAX_BALANCE_USE
+                if quantity * entry_price > max_position_value:
+                    quantity = max_position_value / entry_price
+
+                # Round to exchange precision; SL/TP must sit on the tick grid
+                quantity = Decimal(
+                    self.trader.get_amount_precision(symbol, float(quantity))
+                )
+                stop_loss_price = Decimal(
+                    self.trader.get_price_precision(symbol, float(stop_loss_price))
+                )
+                take_profit_price = Decimal(
+                    self.trader.get_price_precision(symbol, float(take_profit_price))
+                )
+
+                logger.info(
+                    f"Executing {side} {symbol}: "
+                    f"qty={quantity}, entry={entry_price}, "
+                    f"sl={stop_loss_price}, tp={take_profit_price}"
+                )
+
+                # 1. Place main order
+                main_order = await self.trader.create_market_order(
+                    symbol=symbol, side=side.lower(), amount=float(quantity)
+                )
+
+                if not main_order:
+                    logger.error("Failed to execute main order")
+                    return False
+
+                average = main_order.get("average")
+                actual_entry = Decimal(str(average)) if average else entry_price
+                # A spot buy spends USDT; a sell receives it
+                notional = quantity * actual_entry
+                if side == "BUY":
+                    self._usdt_available = usdt_balance - notional
+                else:
+                    self._usdt_available = usdt_balance + notional
+
+            # 2. Place stop loss and take profit orders together
             sl_side = "sell" if side == "BUY" else "buy"
-            sl_order = await self.trader.create_stop_loss_order(
-                symbol=symbol,
-                side=sl_side,
-                amount=quantity,
-                stop_price=stop_loss_price,
-            )
-
-            # 3. Place take profit order
-            tp_order = await self.trader.create_take_profit_order(
-                symbol=symbol,
-                side=sl_side,
-                amount=quantity,
-                price=take_profit_price,
+            sl_order, tp_order = await asyncio.gather(
+                self.trader.create_stop_loss_order(
+                    symbol=symbol,
+                    side=sl_side,
+                    amount=float(quantity),
+                    stop_price=float(stop_loss_price),
+                ),
+                self.trader.create_take_profit_order(
+                    symbol=symbol,
+                    side=sl_side,
+                    amount=float(quantity),
+                    price=float(take_profit_price),
+                ),
+                return_exceptions=True,
             )
-
-            # Record trade in database
-            trade = TradeCreate(
+            if isinstance(sl_order, Exception):
+                logger.error(f"Stop loss order failed for {symbol}: {sl_order}")
+                sl_order = None
+            if isinstance(tp_order, Exception):
+                logger.error(f"Take profit order failed for {symbol}: {tp_order}")
+                tp_order = None
+
+            # Record trade with its order IDs in one insert; every field is
+            # already typed above, so skip re-validation
+            trade = TradeCreate.model_construct(
                 signal_id=signal["id"],
                 symbol=symbol,
                 side=SignalType(side),
-                entry_price=Decimal(str(actual_entry)),
-                quantity=Decimal(str(quantity)),
-                stop_loss_price=Decimal(str(stop_loss_price)),
-                take_profit_price=Decimal(str(take_profit_price)),
-            )
-
-            created_trade = DatabaseClient.create_trade(trade)
-
-            # Update with order IDs
-            DatabaseClient.update_trade_order_ids(
-                trade_id=str(created_trade.id),
+                entry_price=actual_entry,
+                quantity=quantity,
+                stop_loss_price=stop_loss_price,
+                take_profit_price=take_profit_price,
                 exchange_order_id=main_order.get("id"),
                 sl_order_id=sl_order.get("id") if sl_order else None,
                 tp_order_id=tp_order.get("id") if tp_order else None,
             )
 
+            created_trade = await DatabaseClient.create_trade(trade)
+
             logger.info(f"Trade recorded: {created_trade.id}")
             return True
 
@@ -121,9 +156,9 @@ class TradeExecutor:
             logger.error(f"Trade execution failed for {symbol}: {e}", exc_info=True)
             return False
 
-    async def get_current_price(self, symbol: str) -> Optional[float]:
-        """Get current price for a symbol."""
-        return await self.trader.get_current_price(symbol)
+    async def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Get current prices for several symbols at once."""
+        return await self.trader.get_current_prices(symbols)
 
     async def close_position(
         self, symbol: str, side: str, quantity: float
@@ -140,10 +175,10 @@ class TradeExecutor:
             if not self.trader.exchange:
                 return
 
-            balance = await self.trader.exchange.fetch_balance()
+            balance = await self.trader.fetch_balance()
             usdt = balance.get("USDT", {})
 
-            DatabaseClient.update_portfolio(
+            await DatabaseClient.update_portfolio(
                 total_balance=float(usdt.get("total", 0)),
                 available_balance=float(usdt.get("free", 0)),
                 locked_balance=float(usdt.get("used", 0)),
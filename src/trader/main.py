@@ -1,83 +1,145 @@
 """
 Trader Service Entry Point.
-Runs as a Railway cron job every 5 minutes.
+Runs as a Railway cron job every 5 minutes, or as a long-running
+process cycling on its own when TRADER_LONG_RUNNING is set.
 """
 
 import asyncio
-from datetime import datetime
+import signal as os_signal
+import time
+
+# uvloop is optional (not available on Windows); fall back to asyncio's loop
+try:
+    from uvloop import run as _run
+except ImportError:
+    _run = asyncio.run
 
 from src.shared.config import validate_config, TRADING
 from src.shared.db import DatabaseClient
 from src.shared.models import SignalStatus
 from src.shared.logger import get_logger
 from .executor import TradeExecutor
-from .position_manager import PositionManager
+from .position_manager import PositionManager, POSITION_COLUMNS
 
 logger = get_logger(__name__)
 
 
-async def execute_trading_cycle() -> None:
+async def _execute_signal(executor: TradeExecutor, signal: dict) -> bool:
+    """Execute a signal and mark it executed on success."""
+    success = await executor.execute_signal(signal)
+    if success:
+        await DatabaseClient.update_signal_status(
+            signal_id=signal["id"], status=SignalStatus.EXECUTED
+        )
+    return success
+
+
+async def execute_trading_cycle(executor: TradeExecutor) -> None:
     """Main trading cycle orchestrator."""
     logger.info("Starting trading cycle")
-    start_time = datetime.utcnow()
+    start_time = time.monotonic()
 
-    executor = TradeExecutor()
     position_manager = PositionManager()
 
     try:
-        await executor.initialize()
-
         # 1. Check and execute approved signals
-        approved_signals = DatabaseClient.get_approved_signals()
-        open_positions = DatabaseClient.get_open_trades_count()
+        approved_signals, open_positions = await asyncio.gather(
+            DatabaseClient.get_approved_signals(),
+            DatabaseClient.get_open_trades_count(),
+        )
 
         logger.info(
             f"Found {len(approved_signals)} approved signals, "
             f"{open_positions} open positions"
         )
 
-        for signal in approved_signals:
-            # Check position limit
-            if open_positions >= TRADING.MAX_OPEN_POSITIONS:
-                logger.warning(
-                    f"Max positions ({TRADING.MAX_OPEN_POSITIONS}) reached, "
-                    f"skipping signal {signal['id']}"
+        # Fill the free position slots; execute those signals concurrently
+        slots = max(TRADING.MAX_OPEN_POSITIONS - open_positions, 0)
+        to_execute = approved_signals[:slots]
+        for signal in approved_signals[slots:]:
+            logger.warning(
+                f"Max positions ({TRADING.MAX_OPEN_POSITIONS}) reached, "
+                f"skipping signal {signal['id']}"
+            )
+
+        if to_execute:
+            await executor.snapshot_balance()
+        results = await asyncio.gather(
+            *[_execute_signal(executor, s) for s in to_execute],
+            return_exceptions=True,
+        )
+        for signal, result in zip(to_execute, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Execution failed for signal {signal['id']}: {result}",
+                    exc_info=result,
                 )
-                continue
 
-            # Execute the trade
-            success = await executor.execute_signal(signal)
+        # 2. Monitor open positions for SL/TP concurrently
+        open_trades = await DatabaseClient.get_open_trades(columns=POSITION_COLUMNS)
+        prices = await executor.get_current_prices(
+            list({t["symbol"] for t in open_trades})
+        )
 
-            if success:
-                open_positions += 1
-                DatabaseClient.update_signal_status(
-                    signal_id=signal["id"], status=SignalStatus.EXECUTED
+        results = await asyncio.gather(
+            *[
+                position_manager.check_position(t, prices.get(t["symbol"]), executor)
+                for t in open_trades
+            ],
+            return_exceptions=True,
+        )
+        for trade, result in zip(open_trades, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Position check failed for trade {trade['id']}: {result}",
+                    exc_info=result,
                 )
 
-        # 2. Monitor open positions for SL/TP
-        open_trades = DatabaseClient.get_open_trades()
-
-        for trade in open_trades:
-            await position_manager.check_position(trade, executor)
-
         # 3. Update portfolio balance
         await executor.sync_portfolio()
 
-        elapsed = (datetime.utcnow() - start_time).total_seconds()
+        elapsed = time.monotonic() - start_time
         logger.info(f"Trading cycle completed in {elapsed:.2f}s")
 
     except Exception as e:
         logger.error(f"Trading cycle failed: {e}", exc_info=True)
         raise
 
+
+async def run_trader() -> None:
+    """Run one cycle, or keep cycling on one exchange connection."""
+    executor = TradeExecutor()
+
+    try:
+        await executor.initialize()
+
+        if not TRADING.TRADER_LONG_RUNNING:
+            await execute_trading_cycle(executor)
+            return
+
+        # Close connections cleanly when Railway stops the service
+        asyncio.get_running_loop().add_signal_handler(
+            os_signal.SIGTERM, asyncio.current_task().cancel
+        )
+        while True:
+            try:
+                await execute_trading_cycle(executor)
+            except Exception:
+                pass  # Already logged; the next cycle retries
+            await asyncio.sleep(TRADING.TRADER_CYCLE_SECONDS)
+
     finally:
         await executor.close()
+        await DatabaseClient.close()
 
 
 def main() -> None:
-    """Entry point for Railway cron job."""
+    """Entry point for Railway cron job or long-running service."""
     validate_config()
-    asyncio.run(execute_trading_cycle())
+    try:
+        _run(run_trader())
+    except asyncio.CancelledError:
+        logger.info("Trader stopped")
 
 
 if __name__ == "__main__":
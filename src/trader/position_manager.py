@@ -2,7 +2,8 @@
 Position monitoring and management.
 """
 
-from typing import Dict, Any
+from decimal import Decimal
+from typing import Dict, Any, Optional
 
 from src.shared.db import DatabaseClient
 from src.shared.models import TradeStatus
@@ -10,55 +11,55 @@ from src.shared.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Trade columns read by check_position
+POSITION_COLUMNS = (
+    "id,symbol,side,entry_price,quantity,stop_loss_price,take_profit_price"
+)
+
 
 class PositionManager:
     """Monitors and manages open positions."""
 
-    async def check_position(self, trade: Dict[str, Any], executor) -> None:
-        """Check if a position has hit SL or TP."""
+    async def check_position(
+        self, trade: Dict[str, Any], current_price: Optional[float], executor
+    ) -> None:
+        """Check if a position has hit SL or TP at the current price."""
         symbol = trade["symbol"]
-        entry_price = float(trade["entry_price"])
-        stop_loss = float(trade["stop_loss_price"])
-        take_profit = float(trade["take_profit_price"])
+        entry_price = Decimal(str(trade["entry_price"]))
+        stop_loss = Decimal(str(trade["stop_loss_price"]))
+        take_profit = Decimal(str(trade["take_profit_price"]))
         side = trade["side"]
-        quantity = float(trade["quantity"])
+        quantity = Decimal(str(trade["quantity"]))
 
-        # Get current price
-        current_price = await executor.get_current_price(symbol)
         if current_price is None:
             logger.warning(f"Could not get price for {symbol}")
             return
+        current_price = Decimal(str(current_price))
 
-        # Check stop loss / take profit
-        if side == "BUY":
-            hit_sl = current_price <= stop_loss
-            hit_tp = current_price >= take_profit
-        else:
-            hit_sl = current_price >= stop_loss
-            hit_tp = current_price <= take_profit
+        # Check stop loss / take profit; shorts mirror longs via the sign
+        direction = 1 if side == "BUY" else -1
+        hit_sl = direction * (current_price - stop_loss) <= 0
+        hit_tp = direction * (current_price - take_profit) >= 0
 
         if hit_sl or hit_tp:
             status = TradeStatus.STOPPED_OUT if hit_sl else TradeStatus.TAKE_PROFIT
             exit_price = stop_loss if hit_sl else take_profit
 
             # Calculate P&L
-            if side == "BUY":
-                pnl_amount = (exit_price - entry_price) * quantity
-            else:
-                pnl_amount = (entry_price - exit_price) * quantity
+            pnl_amount = direction * (exit_price - entry_price) * quantity
 
             pnl_percentage = (pnl_amount / (entry_price * quantity)) * 100
 
             # Close the position
-            await executor.close_position(symbol, side, quantity)
+            await executor.close_position(symbol, side, float(quantity))
 
             # Update database
-            DatabaseClient.close_trade(
+            await DatabaseClient.close_trade(
                 trade_id=trade["id"],
-                exit_price=exit_price,
+                exit_price=float(exit_price),
                 status=status,
-                pnl_amount=pnl_amount,
-                pnl_percentage=pnl_percentage,
+                pnl_amount=float(pnl_amount),
+                pnl_percentage=float(pnl_percentage),
             )
 
             logger.info(
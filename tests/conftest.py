@@ -2,8 +2,9 @@
 Pytest configuration and shared fixtures.
 """
 
+import numpy as np
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
@@ -15,7 +16,7 @@ from src.shared.models import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_candles():
     """Generate sample OHLCV candles for testing."""
     base_price = 50000
@@ -23,14 +24,16 @@ def sample_candles():
 
     for i in range(100):
         candles.append(
-            OHLCVCandle(
+            OHLCVCandle.model_construct(
                 symbol="BTC/USDT",
                 timeframe="15m",
-                timestamp=datetime(2024, 1, 1, i // 4, (i % 4) * 15),
-                open=Decimal(str(base_price + i * 10)),
-                high=Decimal(str(base_price + i * 10 + 50)),
-                low=Decimal(str(base_price + i * 10 - 50)),
-                close=Decimal(str(base_price + i * 10 + 25)),
+                timestamp=datetime(
+                    2024, 1, 1, i // 4, (i % 4) * 15, tzinfo=timezone.utc
+                ),
+                open=Decimal(base_price + i * 10),
+                high=Decimal(base_price + i * 10 + 50),
+                low=Decimal(base_price + i * 10 - 50),
+                close=Decimal(base_price + i * 10 + 25),
                 volume=Decimal("100.5"),
             )
         )
@@ -38,32 +41,38 @@ def sample_candles():
     return candles
 
 
-@pytest.fixture
-def sample_prices():
+@pytest.fixture(scope="session")
+def sample_prices_list():
     """Generate sample price list for indicator calculations."""
     return [50000 + i * 10 for i in range(100)]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_prices(sample_prices_list):
+    """Generate sample prices as a float64 array."""
+    return np.asarray(sample_prices_list, dtype=np.float64)
+
+
+@pytest.fixture(scope="session")
 def sample_indicators():
     """Generate sample technical indicators."""
     return TechnicalIndicators(
         symbol="BTC/USDT",
-        timestamp=datetime.utcnow(),
+        timestamp=datetime.now(timezone.utc),
         rsi_14=35.5,
-        sma_20=50500,
-        sma_50=50000,
+        sma_20=50500.0,
+        sma_50=50000.0,
         macd_line=150.5,
         macd_signal=100.2,
         macd_histogram=50.3,
-        bb_upper=51000,
-        bb_middle=50500,
-        bb_lower=50000,
-        current_price=50250,
+        bb_upper=51000.0,
+        bb_middle=50500.0,
+        bb_lower=50000.0,
+        current_price=50250.0,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_signal():
     """Generate sample signal for testing."""
     return SignalCreate(
@@ -0,0 +1,75 @@
+"""
+Tests for market condition analysis.
+"""
+
+from dataclasses import replace
+
+import pytest
+from src.analysis_agent.analyzer import analyze_market_conditions
+
+
+class TestRSISignal:
+    @pytest.mark.parametrize(
+        "rsi, expected",
+        [
+            (29.9, "oversold"),
+            (30.0, "neutral"),
+            (50.0, "neutral"),
+            (70.0, "neutral"),
+            (70.1, "overbought"),
+        ],
+    )
+    def test_rsi_boundaries(self, sample_indicators, rsi, expected):
+        """Test RSI classification at threshold boundaries."""
+        indicators = replace(sample_indicators, rsi_14=rsi)
+        context = analyze_market_conditions(indicators)
+        assert context.rsi_signal == expected
+
+
+class TestSentimentSignal:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (20.0, "extreme_fear"),
+            (20.5, "fear"),
+            (40.0, "fear"),
+            (50.0, "neutral"),
+            (60.0, "greed"),
+            (79.9, "greed"),
+            (80.0, "extreme_greed"),
+        ],
+    )
+    def test_sentiment_boundaries(self, sample_indicators, value, expected):
+        """Test sentiment classification at threshold boundaries."""
+        context = analyze_market_conditions(sample_indicators, fear_greed_value=value)
+        assert context.sentiment_signal == expected
+
+    def test_sentiment_average(self, sample_indicators):
+        """Test that both sentiment sources are averaged."""
+        context = analyze_market_conditions(
+            sample_indicators, fear_greed_value=10, coingecko_value=90
+        )
+        assert context.sentiment_signal == "neutral"
+
+    def test_sentiment_missing(self, sample_indicators):
+        """Test neutral sentiment when no data is available."""
+        context = analyze_market_conditions(sample_indicators)
+        assert context.sentiment_signal == "neutral"
+
+
+class TestConfirmingSignals:
+    def test_all_neutral(self, sample_indicators):
+        """Test that a fully neutral context has no confirming signals."""
+        indicators = replace(
+            sample_indicators, sma_20=50000.0, rsi_14=50.0, macd_histogram=None
+        )
+        context = analyze_market_conditions(indicators)
+        assert context.confirming_signals == 0
+
+    def test_counts_non_neutral(self, sample_indicators):
+        """Test that each non-neutral signal is counted."""
+        context = analyze_market_conditions(sample_indicators, fear_greed_value=10)
+        assert context.trend == "bullish"
+        assert context.macd_signal == "bullish_cross"
+        assert context.sentiment_signal == "extreme_fear"
+        assert context.confirming_signals == 3
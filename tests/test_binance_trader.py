@@ -0,0 +1,122 @@
+"""
+Tests for order retries in the Binance trading client.
+"""
+
+import socket
+
+import aiohttp
+import ccxt.async_support as ccxt
+import pytest
+
+from src.trader import binance_trader
+from src.trader.binance_trader import BinanceTrader
+
+
+class FakeExchange:
+    """Replays scripted create_order failures and records every call."""
+
+    def __init__(self, failures, placed=None):
+        self.failures = list(failures)
+        self.placed = placed
+        self.orders = []
+        self.lookups = []
+
+    async def create_order(self, **kwargs):
+        self.orders.append(kwargs["params"]["clientOrderId"])
+        if self.failures:
+            raise self.failures.pop(0)
+        return {"id": "filled"}
+
+    async def fetch_order(self, id, symbol, params):
+        self.lookups.append(params["origClientOrderId"])
+        if self.placed is None:
+            raise ccxt.OrderNotFound("unknown order")
+        return self.placed
+
+
+def unsent_error():
+    """A connect failure, raised before the request was sent."""
+    error = ccxt.ExchangeNotAvailable("binance POST /api/v3/order")
+    error.__cause__ = socket.gaierror("name resolution failed")
+    return error
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    async def sleep(delay):
+        pass
+
+    monkeypatch.setattr(binance_trader.asyncio, "sleep", sleep)
+
+
+def make_trader(exchange):
+    trader = BinanceTrader()
+    trader.exchange = exchange
+    trader._balance = {"USDT": {"free": 100}}
+    return trader
+
+
+class TestOrderRetry:
+    """Tests for BinanceTrader._create_order."""
+
+    async def test_unsent_error_is_resent(self):
+        exchange = FakeExchange([unsent_error()])
+        order = await make_trader(exchange).create_market_order("BTC/USDT", "buy", 1)
+
+        assert order == {"id": "filled"}
+        assert len(exchange.orders) == 2
+        assert len(set(exchange.orders)) == 1
+        assert exchange.lookups == []
+
+    async def test_timeout_returns_order_that_filled(self):
+        exchange = FakeExchange(
+            [ccxt.RequestTimeout("timed out")], placed={"id": "first"}
+        )
+        order = await make_trader(exchange).create_market_order("BTC/USDT", "buy", 1)
+
+        assert order == {"id": "first"}
+        assert len(exchange.orders) == 1
+        assert exchange.lookups == exchange.orders
+
+    async def test_timeout_resends_when_order_unknown(self):
+        exchange = FakeExchange([ccxt.RequestTimeout("timed out")])
+        order = await make_trader(exchange).create_market_order("BTC/USDT", "buy", 1)
+
+        assert order == {"id": "filled"}
+        assert len(exchange.orders) == 2
+        assert len(exchange.lookups) == 1
+
+    async def test_dropped_connection_is_checked_first(self):
+        error = ccxt.ExchangeNotAvailable("binance POST /api/v3/order")
+        error.__cause__ = aiohttp.ServerDisconnectedError()
+        exchange = FakeExchange([error], placed={"id": "first"})
+        order = await make_trader(exchange).create_market_order("BTC/USDT", "buy", 1)
+
+        assert order == {"id": "first"}
+        assert len(exchange.orders) == 1
+
+    async def test_failed_lookup_does_not_resend(self):
+        class LookupDown(FakeExchange):
+            async def fetch_order(self, id, symbol, params):
+                raise ccxt.RequestTimeout("lookup timed out")
+
+        exchange = LookupDown([ccxt.RequestTimeout("timed out")])
+        order = await make_trader(exchange).create_market_order("BTC/USDT", "buy", 1)
+
+        assert order is None
+        assert len(exchange.orders) == 1
+
+    async def test_exchange_rejection_is_not_retried(self):
+        exchange = FakeExchange([ccxt.InsufficientFunds("no balance")])
+        order = await make_trader(exchange).create_market_order("BTC/USDT", "buy", 1)
+
+        assert order is None
+        assert len(exchange.orders) == 1
+
+    async def test_gives_up_after_last_attempt(self):
+        exchange = FakeExchange([unsent_error() for _ in range(3)])
+        trader = make_trader(exchange)
+
+        assert await trader.create_market_order("BTC/USDT", "buy", 1) is None
+        assert len(exchange.orders) == binance_trader.ORDER_ATTEMPTS
+        assert trader._balance is None
@@ -0,0 +1,60 @@
+"""
+Tests for the database client's read cache.
+"""
+
+import pytest
+
+from src.shared import db
+from src.shared.db import _ttl_cached, invalidate_query_cache
+
+
+class FakeQueries:
+    """Counts how often the wrapped query actually runs."""
+
+    calls = 0
+
+    @classmethod
+    @_ttl_cached(10)
+    async def get_rows(cls, status: str = "open"):
+        cls.calls += 1
+        return [status, cls.calls]
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    invalidate_query_cache()
+    FakeQueries.calls = 0
+    yield
+    invalidate_query_cache()
+
+
+class TestTTLCache:
+    """Tests for the TTL query cache."""
+
+    async def test_repeat_reads_hit_cache(self):
+        first = await FakeQueries.get_rows()
+        second = await FakeQueries.get_rows()
+        assert first == second
+        assert FakeQueries.calls == 1
+
+    async def test_keyed_on_arguments(self):
+        await FakeQueries.get_rows("open")
+        await FakeQueries.get_rows(status="closed")
+        assert FakeQueries.calls == 2
+
+    async def test_expires_after_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(db.time, "monotonic", lambda: now[0])
+        await FakeQueries.get_rows()
+        now[0] += 9.9
+        await FakeQueries.get_rows()
+        assert FakeQueries.calls == 1
+        now[0] += 0.2
+        await FakeQueries.get_rows()
+        assert FakeQueries.calls == 2
+
+    async def test_invalidate_forces_refetch(self):
+        await FakeQueries.get_rows()
+        invalidate_query_cache()
+        await FakeQueries.get_rows()
+        assert FakeQueries.calls == 2
@@ -0,0 +1,102 @@
+"""
+Tests for the trade executor's balance snapshot.
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.trader import executor as executor_module
+from src.trader.executor import TradeExecutor
+
+
+class FakeTrader:
+    """Fills every market order at 100 and counts balance reads."""
+
+    exchange = True
+
+    def __init__(self, balance=1000.0):
+        self.balance = balance
+        self.balance_reads = 0
+        self.amounts = []
+
+    async def get_balance(self, asset="USDT"):
+        self.balance_reads += 1
+        return self.balance
+
+    def get_amount_precision(self, symbol, amount):
+        return f"{amount:.4f}"
+
+    def get_price_precision(self, symbol, price):
+        return f"{price:.2f}"
+
+    async def create_market_order(self, symbol, side, amount):
+        self.amounts.append(amount)
+        return {"id": "main", "average": 100.0}
+
+    async def create_stop_loss_order(self, **kwargs):
+        return {"id": "sl"}
+
+    async def create_take_profit_order(self, **kwargs):
+        return {"id": "tp"}
+
+
+@pytest.fixture(autouse=True)
+def fake_db(monkeypatch):
+    created = SimpleNamespace(id="t")
+    db = SimpleNamespace(create_trade=AsyncMock(return_value=created))
+    monkeypatch.setattr(executor_module, "DatabaseClient", db)
+    return db
+
+
+def make_signal(side, stop_loss):
+    return {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "symbol": "BTC/USDT",
+        "signal_type": side,
+        "entry_price": 100,
+        "stop_loss_price": stop_loss,
+        "take_profit_price": 110 if side == "BUY" else 90,
+    }
+
+
+@pytest.fixture
+def executor():
+    executor = TradeExecutor()
+    executor.trader = FakeTrader()
+    return executor
+
+
+class TestBalanceSnapshot:
+    """Tests for sizing entries against one balance snapshot."""
+
+    async def test_buy_spends_from_snapshot(self, executor):
+        await executor.snapshot_balance()
+        assert await executor.execute_signal(make_signal("BUY", 90))
+
+        # 2% of 1000 risked over a 10.00 stop: 2 units filled at 100
+        assert executor.trader.amounts == [2.0]
+        assert executor._usdt_available == Decimal("800")
+
+    async def test_sell_credits_snapshot(self, executor):
+        await executor.snapshot_balance()
+        assert await executor.execute_signal(make_signal("SELL", 110))
+
+        assert executor.trader.amounts == [2.0]
+        assert executor._usdt_available == Decimal("1200")
+
+    async def test_later_entries_size_from_running_balance(self, executor):
+        await executor.snapshot_balance()
+        await executor.execute_signal(make_signal("SELL", 110))
+        await executor.execute_signal(make_signal("BUY", 90))
+
+        # The buy risks 2% of the 1200 held after the sell
+        assert executor.trader.amounts == [2.0, 2.4]
+        assert executor._usdt_available == Decimal("960")
+        assert executor.trader.balance_reads == 1
+
+    async def test_fetches_balance_without_snapshot(self, executor):
+        assert await executor.execute_signal(make_signal("BUY", 90))
+        assert executor.trader.balance_reads == 1
@@ -5,12 +5,14 @@ Tests for technical indicator calculations.
 import pytest
 from src.shared.indicators import (
     calculate_sma,
+    calculate_ema,
     calculate_rsi,
     calculate_macd,
     calculate_bollinger_bands,
     calculate_all_indicators,
 )
-from datetime import datetime
+from src.shared.indicators_nb import all_indicators
+from datetime import datetime, timezone
 
 
 class TestSMA:
@@ -33,6 +35,21 @@ class TestSMA:
         assert sma == 100.0
 
 
+class TestEMA:
+    def test_ema_matches_recurrence(self, sample_prices):
+        """Test EMA against the plain recursive definition."""
+        multiplier = 2 / (12 + 1)
+        expected = sample_prices[0]
+        for price in sample_prices[1:]:
+            expected = (price * multiplier) + (expected * (1 - multiplier))
+
+        assert calculate_ema(sample_prices, 12) == pytest.approx(expected)
+
+    def test_ema_insufficient_data(self):
+        """Test EMA with insufficient data."""
+        assert calculate_ema([100, 200], 12) is None
+
+
 class TestRSI:
     def test_rsi_basic(self, sample_prices):
         """Test basic RSI calculation."""
@@ -62,6 +79,18 @@ class TestMACD:
         assert signal is not None
         assert histogram is not None
 
+    def test_macd_matches_prefix_emas(self, sample_prices):
+        """Test MACD signal line against EMAs of every price prefix."""
+        macd_values = [
+            calculate_ema(sample_prices[: i + 1], 12)
+            - calculate_ema(sample_prices[: i + 1], 26)
+            for i in range(25, len(sample_prices))
+        ]
+        macd_line, signal, _ = calculate_macd(sample_prices)
+
+        assert macd_line == pytest.approx(macd_values[-1])
+        assert signal == pytest.approx(calculate_ema(macd_values, 9))
+
     def test_macd_insufficient_data(self):
         """Test MACD with insufficient data."""
         prices = [100] * 10
@@ -89,10 +118,30 @@ class TestAllIndicators:
     def test_calculate_all(self, sample_prices):
         """Test calculating all indicators at once."""
         indicators = calculate_all_indicators(
-            "BTC/USDT", sample_prices, datetime.utcnow()
+            "BTC/USDT", sample_prices, datetime.now(timezone.utc)
         )
 
         assert indicators.symbol == "BTC/USDT"
         assert indicators.rsi_14 is not None
         assert indicators.sma_20 is not None
         assert indicators.current_price == sample_prices[-1]
+
+    def test_calculate_all_ndarray(self, sample_prices, sample_prices_list):
+        """Test that float64 arrays produce the same indicators as lists."""
+        timestamp = datetime.now(timezone.utc)
+        from_list = calculate_all_indicators("BTC/USDT", sample_prices_list, timestamp)
+        from_array = calculate_all_indicators("BTC/USDT", sample_prices, timestamp)
+
+        assert from_array == from_list
+
+    def test_fused_kernel_matches_numpy(self, sample_prices):
+        """Test the fused kernel against the individual NumPy indicators."""
+        expected = (
+            calculate_rsi(sample_prices, 14),
+            calculate_sma(sample_prices, 20),
+            calculate_sma(sample_prices, 50),
+            *calculate_macd(sample_prices),
+            *calculate_bollinger_bands(sample_prices),
+        )
+
+        assert all_indicators(sample_prices) == pytest.approx(expected)